@@ -4,18 +4,62 @@ Handles loading and managing configuration from YAML files
 with environment-specific overrides.
 """
 
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or cannot be loaded"""
     pass
 
 
+# Marks a dotted key that does not resolve in the configuration
+_MISSING = object()
+
+# Parsed YAML files keyed by (path, mtime in ns)
+_YAML_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """Load a YAML file, reusing the parsed result while the file is unchanged
+    
+    Args:
+        path: Path to YAML file
+        
+    Returns:
+        Deep copy of the parsed YAML content
+    """
+    key = (str(path), path.stat().st_mtime_ns)
+    content = _YAML_CACHE.get(key)
+    
+    if content is None:
+        with open(path, 'r') as f:
+            content = yaml.load(f, Loader=_YamlLoader) or {}
+        _YAML_CACHE[key] = content
+    
+    return copy.deepcopy(content)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dotenv_once() -> bool:
+    """Parse the .env file once per process
+    
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv()
+
+
 class ConfigManager:
     """Manages application configuration with environment-specific overrides"""
     
@@ -29,9 +73,13 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self.environment = environment or os.getenv("ENVIRONMENT", "dev")
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        
+        # Memoized tree walks for keys not in the flat index (sections, misses)
+        self._resolve_cached = functools.lru_cache(maxsize=512)(self._resolve)
         
-        # Load environment variables from .env file
-        load_dotenv()
+        # Load environment variables from .env file (parsed once per process)
+        _load_dotenv_once()
         
         self._load_config()
     
@@ -44,21 +92,22 @@ class ConfigManager:
                 f"Default configuration file not found: {default_config_path}"
             )
         
-        with open(default_config_path, 'r') as f:
-            self._config = yaml.safe_load(f) or {}
+        self._config = _load_yaml(default_config_path)
         
         # Load environment-specific configuration
         env_config_path = self.config_dir / f"{self.environment}.yaml"
         if env_config_path.exists():
-            with open(env_config_path, 'r') as f:
-                env_config = yaml.safe_load(f) or {}
-                self._config = self._merge_configs(self._config, env_config)
+            env_config = _load_yaml(env_config_path)
+            self._config = self._merge_configs(self._config, env_config)
         
         # Override with environment variables for sensitive data
         self._apply_env_overrides()
         
         # Validate configuration
         self._validate_config()
+        
+        # Pre-resolve dotted keys so get() is a single lookup
+        self._flat = self._flatten(self._config)
     
     def _merge_configs(self, base: Dict, override: Dict) -> Dict:
         """Recursively merge override config into base config
@@ -70,15 +119,43 @@ class ConfigManager:
         Returns:
             Merged configuration dictionary
         """
-        merged = base.copy()
+        merged = copy.deepcopy(base)
+        stack = [(merged, override)]
+        
+        # Walk override levels with an explicit stack, updating the copy in place
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
+        
+        return merged
+    
+    def _flatten(self, config: Dict, prefix: str = "") -> Dict[str, Any]:
+        """Flatten nested configuration into dotted keys
         
-        for key, value in override.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = self._merge_configs(merged[key], value)
+        Only leaf values are stored; keys resolving to a sub-dict are
+        looked up by walking the nested configuration instead.
+        
+        Args:
+            config: Configuration dictionary to flatten
+            prefix: Dotted prefix of the current nesting level
+            
+        Returns:
+            Dictionary mapping dotted keys to leaf values
+        """
+        flat = {}
+        
+        for key, value in config.items():
+            dotted_key = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, f"{dotted_key}."))
             else:
-                merged[key] = value
+                flat[dotted_key] = value
         
-        return merged
+        return flat
     
     def _apply_env_overrides(self) -> None:
         """Apply environment variable overrides for sensitive configuration"""
@@ -111,16 +188,36 @@ class ConfigManager:
             default: Default value if key not found
             
         Returns:
-            Configuration value or default
+            Configuration value or default; sections are returned as deep
+            copies, so changing them cannot desynchronize the flat index
+        """
+        try:
+            return self._flat[key]
+        except KeyError:
+            pass
+        
+        value = self._resolve_cached(key)
+        
+        if value is _MISSING:
+            return default
+        return copy.deepcopy(value) if isinstance(value, dict) else value
+    
+    def _resolve(self, key: str) -> Any:
+        """Walk the nested configuration for a dotted key
+        
+        Args:
+            key: Configuration key in dot notation
+            
+        Returns:
+            Configuration value, or _MISSING if the key does not resolve
         """
-        keys = key.split('.')
         value = self._config
         
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
         
         return value
     
@@ -128,11 +225,20 @@ class ConfigManager:
         """Get entire configuration dictionary
         
         Returns:
-            Complete configuration dictionary
+            Deep copy of the complete configuration dictionary
         """
-        return self._config.copy()
+        return copy.deepcopy(self._config)
+    
+    @staticmethod
+    def clear_env_cache() -> None:
+        """Forget the cached .env parse so the next load re-reads it"""
+        _load_dotenv_once.cache_clear()
     
     def reload(self) -> None:
         """Reload configuration from files"""
+        self.clear_env_cache()
+        _load_dotenv_once()
         self._config = {}
+        self._flat = {}
+        self._resolve_cached.cache_clear()
         self._load_config()
@@ -5,21 +5,53 @@ REST APIs, and databases.
 """
 
 import csv
+import functools
+import hashlib
 import logging
 import json
-import time
+import queue
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Iterator
+from typing import Any, Callable, Dict, List, Optional, Iterator, Tuple
 from datetime import datetime
+from itertools import chain, islice, repeat
+from operator import itemgetter, methodcaller
+from uuid import uuid4
 
 import requests
+import numpy as np
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import psycopg2
+import psycopg2.extensions
 import pymysql
+import pymysql.cursors
 
 from src.config_manager import ConfigManager
 
+try:
+    import ijson
+except ImportError:  # Streaming JSON parsing is optional
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib JSON decoder
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # Fall back to chunked pandas parsing, without a Parquet cache
+    pa = None
+    pa_csv = None
+    pq = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +61,162 @@ class IngestionError(Exception):
     pass
 
 
+class RecordBatch:
+    """Column-oriented batch of records from one source
+    
+    Metadata shared by every row is stored once instead of being copied
+    into each record. Row dictionaries are only built by to_records(),
+    by map/zip, which iterate in C, so no per-row Python bytecode runs.
+    """
+    
+    __slots__ = ("columns", "metadata", "num_rows", "row_number_field", "first_row")
+    
+    def __init__(
+        self,
+        columns: Dict[str, List[Any]],
+        metadata: Dict[str, Any],
+        num_rows: int,
+        row_number_field: Optional[str] = None,
+        first_row: int = 1
+    ):
+        """Initialize record batch
+        
+        Args:
+            columns: One list of values per column, in field order
+            metadata: Constant fields that apply to every row
+            num_rows: Number of rows in the batch
+            row_number_field: Optional field numbering rows from first_row
+            first_row: Number of the first row in the batch
+        """
+        self.columns = columns
+        self.metadata = metadata
+        self.num_rows = num_rows
+        self.row_number_field = row_number_field
+        self.first_row = first_row
+    
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> "RecordBatch":
+        """Transpose row dictionaries into a batch
+        
+        Keys missing from a row become None in its column.
+        
+        Args:
+            records: Row dictionaries
+            
+        Returns:
+            RecordBatch without shared metadata
+        """
+        keys = dict.fromkeys(chain.from_iterable(records))
+        columns = {key: [record.get(key) for record in records] for key in keys}
+        return cls(columns, {}, len(records))
+    
+    def __len__(self) -> int:
+        return self.num_rows
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize the batch as row dictionaries
+        
+        Returns:
+            List of row dictionaries with metadata merged in
+        """
+        keys = (*self.columns, *self.metadata)
+        values = [*self.columns.values(), *map(repeat, self.metadata.values())]
+        
+        if self.row_number_field is not None:
+            keys += (self.row_number_field,)
+            values.append(range(self.first_row, self.first_row + self.num_rows))
+        
+        # islice bounds rows when every column is a repeated metadata value
+        rows = islice(zip(*values), self.num_rows)
+        return list(map(dict, map(zip, repeat(keys), rows)))
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Materialize the batch as a DataFrame for vectorized checks
+        
+        Returns:
+            DataFrame with one column per field, metadata broadcast
+        """
+        frame = pd.DataFrame(self.columns, index=pd.RangeIndex(self.num_rows))
+        
+        for key, value in self.metadata.items():
+            frame[key] = value
+        
+        if self.row_number_field is not None:
+            frame[self.row_number_field] = range(self.first_row, self.first_row + self.num_rows)
+        
+        return frame
+    
+    def to_arrow(self):
+        """Convert the batch to a pyarrow RecordBatch
+        
+        Metadata becomes constant columns built with pyarrow.repeat, so
+        nothing is copied per row in Python. The result can be handed to
+        Arrow compute kernels or written to an IPC stream.
+        
+        Returns:
+            pyarrow.RecordBatch with one column per field
+            
+        Raises:
+            IngestionError: If pyarrow is not installed
+        """
+        if pa is None:
+            raise IngestionError("pyarrow is required for Arrow record batches")
+        
+        arrays = [pa.array(values) for values in self.columns.values()]
+        names = list(self.columns)
+        
+        for key, value in self.metadata.items():
+            arrays.append(pa.repeat(value, self.num_rows))
+            names.append(key)
+        
+        if self.row_number_field is not None:
+            arrays.append(pa.array(
+                np.arange(self.first_row, self.first_row + self.num_rows, dtype=np.int64)
+            ))
+            names.append(self.row_number_field)
+        
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_session(
+    max_retries: int,
+    retry_delay: float,
+    retry_jitter: float
+) -> requests.Session:
+    """Get the HTTP session shared by API sources with the same retry policy
+    
+    Sharing the session keeps pooled keep-alive connections (and their
+    TLS handshakes) alive across sources and pages.
+    
+    Args:
+        max_retries: Total attempts per request
+        retry_delay: Exponential backoff factor in seconds
+        retry_jitter: Upper bound of random seconds added to each backoff
+        
+    Returns:
+        Session whose adapters retry with jittered exponential backoff
+    """
+    retry = Retry(
+        total=max(max_retries - 1, 0),  # max_retries counts attempts
+        backoff_factor=retry_delay,
+        backoff_jitter=retry_jitter,  # De-synchronize clients retrying together
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=16, pool_maxsize=32)
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class DataSource(ABC):
     """Abstract base class for data sources"""
     
+    __slots__ = ("config", "error_count", "success_count")
+    
     def __init__(self, config: ConfigManager):
         self.config = config
         self.error_count = 0
@@ -46,6 +231,23 @@ class DataSource(ABC):
         """
         pass
     
+    def ingest_batches(self) -> Iterator[RecordBatch]:
+        """Ingest data from the source as column-oriented batches
+        
+        Sources without a columnar reader transpose their ingest() records.
+        
+        Yields:
+            RecordBatch of up to ingestion.batch_size records
+        """
+        batch_size = self.config.get("ingestion.batch_size", 1000)
+        records = self.ingest()
+        
+        while True:
+            chunk = list(islice(records, batch_size))
+            if not chunk:
+                break
+            yield RecordBatch.from_records(chunk)
+    
     def get_stats(self) -> Dict[str, int]:
         """Get ingestion statistics
         
@@ -61,6 +263,13 @@ class DataSource(ABC):
 class CSVDataSource(DataSource):
     """Ingest data from CSV files"""
     
+    __slots__ = (
+        "file_path", "delimiter", "encoding", "batch_size", "reject_ragged_rows", "cache_path"
+    )
+    
+    # Bytes of CSV text per Arrow parse block; blocks are parsed in parallel
+    ARROW_BLOCK_SIZE = 1 << 20
+    
     def __init__(self, config: ConfigManager, file_path: str):
         super().__init__(config)
         self.file_path = Path(file_path)
@@ -76,6 +285,51 @@ class CSVDataSource(DataSource):
             raise IngestionError(
                 f"CSV file too large: {file_size_mb:.2f}MB > {max_size}MB"
             )
+        
+        self.delimiter = config.get("ingestion.sources.csv.delimiter", ",")
+        self.encoding = config.get("ingestion.sources.csv.encoding", "utf-8")
+        self.batch_size = config.get("ingestion.batch_size", 1000)
+        self.reject_ragged_rows = config.get("ingestion.sources.csv.reject_ragged_rows", False)
+        self.cache_path = self._get_cache_path(
+            config.get("ingestion.sources.csv.cache_dir")
+        )
+    
+    def _get_cache_path(self, cache_dir: Optional[str]) -> Optional[Path]:
+        """Locate the Parquet cache for the current version of the file
+        
+        The name is a key for the file's path followed by a key for its
+        modification time and size plus the parse options, so an edited
+        file never hits a stale cache and older versions of the same file
+        can be found and evicted (see _evict_stale_caches).
+        
+        Args:
+            cache_dir: Cache directory, or None to disable caching
+            
+        Returns:
+            Path of the cache file, or None if caching is unavailable
+        """
+        if not cache_dir or pq is None:
+            return None
+        
+        stat = self.file_path.stat()
+        source_key = hashlib.blake2b(
+            str(self.file_path.resolve()).encode(), digest_size=8
+        ).hexdigest()
+        fingerprint = f"{stat.st_mtime_ns}:{stat.st_size}:{self.delimiter}:{self.encoding}"
+        version_key = hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+        return Path(cache_dir) / f"{source_key}-{version_key}.parquet"
+    
+    def _evict_stale_caches(self) -> None:
+        """Delete cache files left by earlier versions of this CSV file
+        
+        Called after a new cache is published, so each source file keeps
+        at most one cache entry per directory.
+        """
+        source_key = self.cache_path.name.split("-", 1)[0]
+        
+        for stale_path in self.cache_path.parent.glob(f"{source_key}-*.parquet"):
+            if stale_path != self.cache_path:
+                stale_path.unlink(missing_ok=True)
     
     def ingest(self) -> Iterator[Dict[str, Any]]:
         """Ingest data from CSV file
@@ -83,78 +337,368 @@ class CSVDataSource(DataSource):
         Yields:
             Dictionary representing a single row
         """
-        delimiter = self.config.get("ingestion.sources.csv.delimiter", ",")
-        encoding = self.config.get("ingestion.sources.csv.encoding", "utf-8")
+        for batch in self.ingest_batches():
+            records = batch.to_records()
+            
+            if None in batch.columns:
+                # Like csv.DictReader, only rows with extra values get the None key
+                for record in records:
+                    if record[None] is None:
+                        del record[None]
+            
+            yield from records
+    
+    def ingest_batches(self) -> Iterator[RecordBatch]:
+        """Ingest data from CSV file as column-oriented batches
         
-        logger.info(f"Starting CSV ingestion from: {self.file_path}")
+        Yields:
+            RecordBatch per parsed chunk of the file
+        """
+        logger.info("Starting CSV ingestion from: %s", self.file_path)
         
         try:
-            with open(self.file_path, 'r', encoding=encoding) as f:
-                reader = csv.DictReader(f, delimiter=delimiter)
+            row_num = 2  # Start at 2 (header is 1)
+            source_file = str(self.file_path)
+            
+            for columns, column_values in self._iter_column_batches():
+                # Add metadata (timestamp refreshed once per batch)
+                metadata = {
+                    '_source': 'csv',
+                    '_source_file': source_file,
+                    '_ingestion_timestamp': datetime.utcnow().isoformat()
+                }
+                num_rows = len(column_values[0]) if column_values else 0
+                batch = RecordBatch(
+                    dict(zip(columns, column_values)),
+                    metadata,
+                    num_rows,
+                    row_number_field='_row_number',
+                    first_row=row_num
+                )
+                row_num += num_rows
                 
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is 1)
-                    try:
-                        # Add metadata
-                        row['_source'] = 'csv'
-                        row['_source_file'] = str(self.file_path)
-                        row['_ingestion_timestamp'] = datetime.utcnow().isoformat()
-                        row['_row_number'] = row_num
-                        
-                        self.success_count += 1
-                        yield row
-                        
-                    except Exception as e:
-                        self.error_count += 1
-                        logger.error(f"Error processing row {row_num}: {e}")
-                        continue
+                self.success_count += num_rows
+                yield batch
+        
+        except pd.errors.EmptyDataError:
+            logger.warning("CSV file is empty: %s", self.file_path)
         
         except Exception as e:
             raise IngestionError(f"Failed to read CSV file: {e}")
         
-        logger.info(f"CSV ingestion complete. Success: {self.success_count}, Errors: {self.error_count}")
+        logger.info(
+            "CSV ingestion complete. Success: %s, Errors: %s",
+            self.success_count, self.error_count
+        )
+    
+    def _iter_column_batches(self) -> Iterator[Tuple[List[str], List[List[Any]]]]:
+        """Parse the file into batches of column value lists
+        
+        Uses PyArrow's multi-threaded reader when it is installed, otherwise
+        the csv module. Either way every value is kept as the raw string
+        csv.DictReader would produce. Files with a row whose field count
+        differs from the header always go through the csv module, so such
+        rows are handled the same way with or without PyArrow.
+        
+        Yields:
+            Tuple of (column names, one list of values per column)
+        """
+        if self.cache_path is not None:
+            yield from self._iter_cached_batches()
+            return
+        
+        batches = self._read_arrow_batches() if pa_csv is not None else None
+        
+        if batches is None:
+            yield from self._read_csv_batches()
+            return
+        
+        for batch in batches:
+            yield batch.schema.names, [column.to_pylist() for column in batch.columns]
+    
+    def _read_csv_batches(self) -> Iterator[Tuple[List[str], List[List[Any]]]]:
+        """Parse the file with the csv module, batch_size rows at a time
+        
+        Each batch of row lists is transposed into columns in C. Blank
+        lines are skipped and rows with more or fewer fields than the
+        header are fitted to it, as csv.DictReader does, unless
+        reject_ragged_rows is set.
+        
+        Yields:
+            Tuple of (column names, one list of values per column)
+            
+        Raises:
+            IngestionError: If reject_ragged_rows is set and a row has more
+                or fewer fields than the header
+        """
+        with open(self.file_path, newline="", encoding=self.encoding) as handle:
+            reader = csv.reader(handle, delimiter=self.delimiter)
+            header = self._read_header(reader)
+            width = len(header)
+            row_num = 2
+            
+            while True:
+                rows = list(islice(reader, self.batch_size))
+                if not rows:
+                    return
+                
+                if not all(rows):
+                    rows = [row for row in rows if row]
+                
+                columns = header
+                
+                if set(map(len, rows)) - {width}:
+                    if self.reject_ragged_rows:
+                        offset, row = next(
+                            (idx, row) for idx, row in enumerate(rows) if len(row) != width
+                        )
+                        raise self._ragged_row_error(width, len(row), row_num + offset)
+                    
+                    rows, extras = self._fit_ragged_rows(rows, width)
+                    if extras is not None:
+                        columns = header + [None]
+                        rows = [row + [extra] for row, extra in zip(rows, extras)]
+                
+                if rows:
+                    yield columns, list(map(list, zip(*rows)))
+                row_num += len(rows)
+    
+    @staticmethod
+    def _read_header(reader: Iterator[List[str]]) -> List[str]:
+        """Read the header row from a csv.reader
+        
+        Args:
+            reader: csv.reader positioned at the start of the file
+            
+        Returns:
+            Column names, without a UTF-8 byte order mark
+            
+        Raises:
+            pd.errors.EmptyDataError: If the file has no header row
+        """
+        header = next(reader, None)
+        
+        if not header:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+        
+        # Arrow drops a UTF-8 byte order mark, so the csv path must too
+        header[0] = header[0].lstrip("\ufeff")
+        return header
+    
+    @staticmethod
+    def _fit_ragged_rows(
+        rows: List[List[str]],
+        width: int
+    ) -> Tuple[List[List[Optional[str]]], Optional[List[Optional[List[str]]]]]:
+        """Fit rows to the header width the way csv.DictReader does
+        
+        Args:
+            rows: Parsed rows, some with more or fewer fields than the header
+            width: Number of header fields
+            
+        Returns:
+            Tuple of (rows padded with None or cut to width, the values past
+            the header per row for the None key, or None if no row has any)
+        """
+        extras = [row[width:] or None for row in rows]
+        fitted = [
+            row if len(row) == width else row[:width] + [None] * (width - len(row))
+            for row in rows
+        ]
+        return fitted, extras if any(extras) else None
+    
+    @staticmethod
+    def _ragged_row_error(expected: int, actual: int, row: int) -> IngestionError:
+        """Build the error for a row whose field count differs from the header
+        
+        Args:
+            expected: Number of header fields
+            actual: Number of fields in the row
+            row: Row number in the file (header is row 1)
+            
+        Returns:
+            IngestionError describing the row
+        """
+        return IngestionError(f"CSV row {row} has {actual} fields, expected {expected}")
+    
+    def _iter_cached_batches(self) -> Iterator[Tuple[List[str], List[List[Any]]]]:
+        """Read the file's Parquet cache, building it on the first read
+        
+        On a miss the CSV is parsed with Arrow and each batch is written to
+        a temporary file as it is yielded; the cache is only published
+        once the whole file has been read, replacing any cache of an earlier
+        version. Files with ragged rows are parsed by the csv module and
+        never cached.
+        
+        Yields:
+            Tuple of (column names, one list of values per column)
+        """
+        if self.cache_path.exists():
+            with pq.ParquetFile(self.cache_path) as parquet_file:
+                for batch in parquet_file.iter_batches(batch_size=self.batch_size):
+                    yield batch.schema.names, [column.to_pylist() for column in batch.columns]
+            return
+        
+        batches = self._read_arrow_batches()
+        
+        if batches is None:
+            yield from self._read_csv_batches()
+            return
+        
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = self.cache_path.with_name(f"{self.cache_path.name}.{uuid4().hex}.tmp")
+        writer = None
+        
+        try:
+            for batch in batches:
+                if writer is None:
+                    writer = pq.ParquetWriter(partial_path, batch.schema, compression="zstd")
+                writer.write_table(pa.Table.from_batches([batch]))
+                
+                yield batch.schema.names, [column.to_pylist() for column in batch.columns]
+            
+            if writer is not None:
+                writer.close()
+                writer = None
+                partial_path.replace(self.cache_path)
+                self._evict_stale_caches()
+        finally:
+            # Abandoned or failed reads leave no partial cache behind
+            if writer is not None:
+                writer.close()
+            partial_path.unlink(missing_ok=True)
+    
+    def _read_arrow_batches(self) -> Optional[List[Any]]:
+        """Parse the file with pyarrow.csv, every column as a string
+        
+        The file is split into ARROW_BLOCK_SIZE blocks that are parsed on
+        Arrow's thread pool with the GIL released; the streaming reader
+        (open_csv) is single-threaded. Files are already capped by
+        max_file_size_mb, so holding the parsed table is bounded.
+        
+        Nothing is yielded from a file until it has been fully parsed, so
+        a ragged row gives up on Arrow and leaves the whole file to the
+        csv module, which decides how such rows are handled.
+        
+        Returns:
+            List of Arrow record batches of up to batch_size rows, or None
+            if the file has a row whose field count differs from the header
+        """
+        with open(self.file_path, newline="", encoding=self.encoding) as handle:
+            header = self._read_header(csv.reader(handle, delimiter=self.delimiter))
+        
+        # Set from whichever parse thread meets the first ragged row
+        ragged = []
+        
+        def stop_at_ragged_row(row) -> str:
+            ragged.append(row)
+            return "error"
+        
+        try:
+            table = pa_csv.read_csv(
+                self.file_path,
+                read_options=pa_csv.ReadOptions(
+                    block_size=self.ARROW_BLOCK_SIZE,
+                    use_threads=True,
+                    encoding=self.encoding
+                ),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=self.delimiter,
+                    invalid_row_handler=stop_at_ragged_row
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False
+                )
+            )
+        except pa.ArrowInvalid:
+            if ragged:
+                return None
+            raise
+        
+        return table.to_batches(max_chunksize=self.batch_size)
 
 
 class APIDataSource(DataSource):
     """Ingest data from REST APIs"""
     
-    def __init__(self, config: ConfigManager, endpoint: str, params: Optional[Dict] = None):
+    __slots__ = (
+        "endpoint", "params", "pages", "timeout", "max_retries", "retry_delay",
+        "retry_jitter", "records_path", "max_concurrent_requests", "api_key", "session"
+    )
+    
+    def __init__(
+        self,
+        config: ConfigManager,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        pages: Optional[List[Dict]] = None
+    ):
+        """Initialize API source
+        
+        Args:
+            config: Configuration manager
+            endpoint: URL to fetch
+            params: Query parameters sent with every request
+            pages: Optional per-page query parameters (e.g. {"page": 2}),
+                merged over params; pages are fetched concurrently
+        """
         super().__init__(config)
         self.endpoint = endpoint
         self.params = params or {}
+        self.pages = pages or []
         self.timeout = config.get("ingestion.sources.api.timeout_seconds", 30)
         self.max_retries = config.get("ingestion.sources.api.max_retries", 3)
         self.retry_delay = config.get("ingestion.sources.api.retry_delay_seconds", 5)
+        self.retry_jitter = config.get("ingestion.sources.api.retry_jitter_seconds", 1.0)
+        self.records_path = config.get("ingestion.sources.api.records_path")
+        self.max_concurrent_requests = config.get(
+            "ingestion.sources.api.max_concurrent_requests", 8
+        )
+        self.api_key = config.get("api.api_key")
+        self.session = self._create_session()
     
-    def _make_request_with_retry(self) -> requests.Response:
+    def _create_session(self) -> requests.Session:
+        """Get the pooled HTTP session for this source's retry policy
+        
+        Returns:
+            Session whose adapters retry with exponential backoff
+        """
+        return _shared_session(self.max_retries, self.retry_delay, self.retry_jitter)
+    
+    def _make_request_with_retry(
+        self,
+        stream: bool = False,
+        params: Optional[Dict] = None
+    ) -> requests.Response:
         """Make HTTP request with retry logic
         
+        Retries and backoff are handled by the session's transport adapter.
+        
+        Args:
+            stream: Defer downloading the body until it is read
+            params: Query parameters; defaults to the source's params
+            
         Returns:
             Response object
             
         Raises:
             IngestionError if all retries fail
         """
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.get(
-                    self.endpoint,
-                    params=self.params,
-                    timeout=self.timeout,
-                    headers=self._get_headers()
-                )
-                response.raise_for_status()
-                return response
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(
-                        f"API request failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {wait_time}s..."
-                    )
-                    time.sleep(wait_time)
-                else:
-                    raise IngestionError(f"API request failed after {self.max_retries} attempts: {e}")
+        try:
+            response = self.session.get(
+                self.endpoint,
+                params=self.params if params is None else params,
+                timeout=self.timeout,
+                headers=self._get_headers(),
+                stream=stream
+            )
+            response.raise_for_status()
+            return response
+            
+        except requests.exceptions.RequestException as e:
+            raise IngestionError(f"API request failed after {self.max_retries} attempts: {e}")
     
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers including authentication
@@ -164,40 +708,159 @@ class APIDataSource(DataSource):
         """
         headers = {"Accept": "application/json"}
         
-        api_key = self.config.get("api.api_key")
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
         
         return headers
     
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Any:
+        """Decode a JSON response body
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            Decoded JSON data
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass  # e.g. non-UTF-8 body; let requests detect the encoding
+        return response.json()
+    
+    def _extract_records(self, data: Any) -> List[Any]:
+        """Extract the list of records from a decoded response body
+        
+        When records_path is set it selects the records, exactly as the
+        streaming parser would, so a config returns the same records
+        whether or not ijson is installed.
+        
+        Args:
+            data: Decoded JSON response
+            
+        Returns:
+            List of records
+        """
+        if self.records_path:
+            return self._items_at_path(data, self.records_path)
+        
+        # Handle different response formats
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and 'data' in data:
+            return data['data']
+        elif isinstance(data, dict) and 'results' in data:
+            return data['results']
+        return [data]
+    
+    @staticmethod
+    def _items_at_path(data: Any, path: str) -> List[Any]:
+        """Select the values under an ijson prefix in decoded JSON
+        
+        Prefix components are object keys separated by dots, and "item"
+        steps into every element of an array, as in ijson.items().
+        
+        Args:
+            data: Decoded JSON response
+            path: ijson prefix, e.g. "item" or "data.item"
+            
+        Returns:
+            Values found under the prefix, in document order
+        """
+        values = [data]
+        
+        for key in path.split("."):
+            selected = []
+            for value in values:
+                if key == "item" and isinstance(value, list):
+                    selected.extend(value)
+                elif isinstance(value, dict) and key in value:
+                    selected.append(value[key])
+            values = selected
+        
+        return values
+    
+    def _fetch_page(self, page_params: Dict) -> List[Any]:
+        """Fetch and decode the records of one page
+        
+        Args:
+            page_params: Query parameters merged over the source's params
+            
+        Returns:
+            List of records
+        """
+        response = self._make_request_with_retry(params={**self.params, **page_params})
+        
+        try:
+            return self._extract_records(self._decode_json(response))
+        finally:
+            response.close()
+    
+    def _iter_pages(self) -> Iterator[List[Any]]:
+        """Fetch pages concurrently, yielding their records in page order
+        
+        At most max_concurrent_requests pages are in flight; the next page
+        is only requested once the oldest one has been handed out.
+        
+        Yields:
+            List of records for each page
+        """
+        workers = max(1, min(self.max_concurrent_requests, len(self.pages)))
+        pages = iter(self.pages)
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-page") as executor:
+            pending = deque(
+                executor.submit(self._fetch_page, page_params)
+                for page_params in islice(pages, workers)
+            )
+            
+            try:
+                while pending:
+                    records = pending.popleft().result()
+                    
+                    for page_params in islice(pages, 1):
+                        pending.append(executor.submit(self._fetch_page, page_params))
+                    
+                    yield records
+            finally:
+                for future in pending:
+                    future.cancel()
+    
     def ingest(self) -> Iterator[Dict[str, Any]]:
         """Ingest data from API endpoint
         
         Yields:
             Dictionary representing a single record
         """
-        logger.info(f"Starting API ingestion from: {self.endpoint}")
+        logger.info("Starting API ingestion from: %s", self.endpoint)
+        
+        response = None
         
         try:
-            response = self._make_request_with_retry()
-            data = response.json()
-            
-            # Handle different response formats
-            if isinstance(data, list):
-                records = data
-            elif isinstance(data, dict) and 'data' in data:
-                records = data['data']
-            elif isinstance(data, dict) and 'results' in data:
-                records = data['results']
+            if self.pages:
+                records = chain.from_iterable(self._iter_pages())
+            elif self.records_path and ijson is not None:
+                # Parse records incrementally as the body arrives
+                response = self._make_request_with_retry(stream=True)
+                response.raw.decode_content = True
+                records = ijson.items(response.raw, self.records_path, use_float=True)
             else:
-                records = [data]
+                response = self._make_request_with_retry()
+                records = self._extract_records(self._decode_json(response))
+            
+            # Metadata is identical for every record of an ingest
+            metadata = {
+                '_source': 'api',
+                '_source_endpoint': self.endpoint,
+                '_ingestion_timestamp': datetime.utcnow().isoformat()
+            }
             
             for idx, record in enumerate(records):
                 try:
                     # Add metadata
-                    record['_source'] = 'api'
-                    record['_source_endpoint'] = self.endpoint
-                    record['_ingestion_timestamp'] = datetime.utcnow().isoformat()
+                    record.update(metadata)
                     record['_record_number'] = idx + 1
                     
                     self.success_count += 1
@@ -205,18 +868,31 @@ class APIDataSource(DataSource):
                     
                 except Exception as e:
                     self.error_count += 1
-                    logger.error(f"Error processing API record {idx}: {e}")
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error("Error processing API record %s: %s", idx, e)
                     continue
         
         except Exception as e:
             raise IngestionError(f"API ingestion failed: {e}")
         
-        logger.info(f"API ingestion complete. Success: {self.success_count}, Errors: {self.error_count}")
+        finally:
+            if response is not None:
+                response.close()
+        
+        logger.info(
+            "API ingestion complete. Success: %s, Errors: %s",
+            self.success_count, self.error_count
+        )
 
 
 class DatabaseDataSource(DataSource):
     """Ingest data from databases (PostgreSQL, MySQL)"""
     
+    __slots__ = (
+        "query", "db_type", "host", "port", "database", "username",
+        "password", "timeout", "batch_size"
+    )
+    
     def __init__(
         self,
         config: ConfigManager,
@@ -229,6 +905,14 @@ class DatabaseDataSource(DataSource):
         
         if self.db_type not in ["postgresql", "mysql"]:
             raise IngestionError(f"Unsupported database type: {db_type}")
+        
+        self.host = config.get("database.host", "localhost")
+        self.port = config.get("database.port", 5432)
+        self.database = config.get("database.database")
+        self.username = config.get("database.username")
+        self.password = config.get("database.password")
+        self.timeout = config.get("ingestion.sources.database.connection_timeout", 10)
+        self.batch_size = config.get("ingestion.batch_size", 1000)
     
     def _get_connection(self):
         """Get database connection based on type
@@ -236,81 +920,104 @@ class DatabaseDataSource(DataSource):
         Returns:
             Database connection object
         """
-        host = self.config.get("database.host", "localhost")
-        port = self.config.get("database.port", 5432)
-        database = self.config.get("database.database")
-        username = self.config.get("database.username")
-        password = self.config.get("database.password")
-        timeout = self.config.get("ingestion.sources.database.connection_timeout", 10)
-        
         try:
             if self.db_type == "postgresql":
                 return psycopg2.connect(
-                    host=host,
-                    port=port,
-                    database=database,
-                    user=username,
-                    password=password,
-                    connect_timeout=timeout
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.username,
+                    password=self.password,
+                    connect_timeout=self.timeout
                 )
             else:  # mysql
                 return pymysql.connect(
-                    host=host,
-                    port=port,
-                    database=database,
-                    user=username,
-                    password=password,
-                    connect_timeout=timeout
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.username,
+                    password=self.password,
+                    connect_timeout=self.timeout
                 )
         except Exception as e:
             raise IngestionError(f"Database connection failed: {e}")
     
+    def _open_cursor(self, connection, batch_size: int):
+        """Open a server-side cursor that streams results in batches
+        
+        Rows come back as plain tuples; dict cursors would build every row
+        dictionary in Python inside the driver.
+        
+        Args:
+            connection: Database connection object
+            batch_size: Number of rows to transfer per round-trip
+            
+        Returns:
+            Database cursor object
+        """
+        if self.db_type == "postgresql":
+            # Named cursors are server-side; rows are pulled itersize at a time
+            cursor = connection.cursor(
+                name=f"ingest_{uuid4().hex}",
+                cursor_factory=psycopg2.extensions.cursor
+            )
+            cursor.itersize = batch_size
+            return cursor
+        
+        # Unbuffered cursor: rows are read from the socket as they are fetched
+        return connection.cursor(pymysql.cursors.SSCursor)
+    
     def ingest(self) -> Iterator[Dict[str, Any]]:
         """Ingest data from database query
         
         Yields:
             Dictionary representing a single row
         """
-        logger.info(f"Starting database ingestion ({self.db_type})")
+        for batch in self.ingest_batches():
+            yield from batch.to_records()
+    
+    def ingest_batches(self) -> Iterator[RecordBatch]:
+        """Ingest data from database query as column-oriented batches
+        
+        Yields:
+            RecordBatch per fetched batch of rows
+        """
+        logger.info("Starting database ingestion (%s)", self.db_type)
         
         connection = None
         cursor = None
         
         try:
             connection = self._get_connection()
-            cursor = connection.cursor()
+            cursor = self._open_cursor(connection, self.batch_size)
             
             # Execute query
             cursor.execute(self.query)
             
-            # Get column names
-            columns = [desc[0] for desc in cursor.description]
-            
-            # Fetch and yield rows
-            batch_size = self.config.get("ingestion.batch_size", 1000)
+            # Column names are resolved once; a named cursor only has a
+            # description after the first fetch
+            names = None
             
             while True:
-                rows = cursor.fetchmany(batch_size)
+                rows = cursor.fetchmany(self.batch_size)
                 if not rows:
                     break
                 
-                for row in rows:
-                    try:
-                        # Convert row to dictionary
-                        record = dict(zip(columns, row))
-                        
-                        # Add metadata
-                        record['_source'] = 'database'
-                        record['_source_db_type'] = self.db_type
-                        record['_ingestion_timestamp'] = datetime.utcnow().isoformat()
-                        
-                        self.success_count += 1
-                        yield record
-                        
-                    except Exception as e:
-                        self.error_count += 1
-                        logger.error(f"Error processing database row: {e}")
-                        continue
+                if names is None:
+                    names = [column[0] for column in cursor.description]
+                
+                # Metadata is identical for every row of a fetched batch
+                metadata = {
+                    '_source': 'database',
+                    '_source_db_type': self.db_type,
+                    '_ingestion_timestamp': datetime.utcnow().isoformat()
+                }
+                
+                # Transpose the row tuples into columns in C
+                columns = dict(zip(names, map(list, zip(*rows))))
+                
+                self.success_count += len(rows)
+                yield RecordBatch(columns, metadata, len(rows))
         
         except Exception as e:
             raise IngestionError(f"Database ingestion failed: {e}")
@@ -321,15 +1028,23 @@ class DatabaseDataSource(DataSource):
             if connection:
                 connection.close()
         
-        logger.info(f"Database ingestion complete. Success: {self.success_count}, Errors: {self.error_count}")
+        logger.info(
+            "Database ingestion complete. Success: %s, Errors: %s",
+            self.success_count, self.error_count
+        )
 
 
 class DataIngestionPipeline:
     """Main pipeline for orchestrating data ingestion"""
     
+    # Marks a finished source on the hand-off queue
+    _DONE = object()
+    
     def __init__(self, config: ConfigManager):
         self.config = config
         self.sources: List[DataSource] = []
+        self.parallel_workers = config.get("ingestion.parallel_workers", 1)
+        self.batch_size = config.get("ingestion.batch_size", 1000)
     
     def add_source(self, source: DataSource) -> None:
         """Add a data source to the pipeline
@@ -339,29 +1054,225 @@ class DataIngestionPipeline:
         """
         self.sources.append(source)
     
-    def run(self) -> List[Dict[str, Any]]:
-        """Run the ingestion pipeline
+    def iter_run(self) -> Iterator[Dict[str, Any]]:
+        """Run the ingestion pipeline, streaming records as they are ingested
         
-        Returns:
-            List of all ingested records
+        Sources are drained one after another by default. With
+        ``ingestion.parallel_workers`` above 1 they are drained concurrently
+        on a thread pool, so their I/O latency overlaps; each source's
+        records keep their order, but records from different sources may
+        then arrive interleaved in any order. run() always returns them
+        grouped by source.
+        
+        Yields:
+            Dictionary representing a single record
+        """
+        logger.info("Starting ingestion pipeline with %s sources", len(self.sources))
+        
+        workers = self._worker_count()
+        
+        if workers > 1:
+            chunks = map(itemgetter(1), self._iter_parallel(workers, self._record_chunks))
+            records = chain.from_iterable(chunks)
+        else:
+            records = self._iter_sequential(methodcaller("ingest"))
+        
+        total_records = 0
+        
+        for record in records:
+            total_records += 1
+            yield record
+        
+        logger.info("Pipeline complete. Total records ingested: %s", total_records)
+    
+    def iter_batches(self) -> Iterator[RecordBatch]:
+        """Run the ingestion pipeline, streaming column-oriented batches
+        
+        Sources are drained like iter_run(), but records stay in columns
+        with shared metadata stored once per batch, ready for vectorized
+        validation via RecordBatch.to_frame().
+        
+        Yields:
+            RecordBatch from one of the sources
+        """
+        logger.info("Starting batch ingestion pipeline with %s sources", len(self.sources))
+        
+        workers = self._worker_count()
+        read_batches = methodcaller("ingest_batches")
+        
+        if workers > 1:
+            batches = map(itemgetter(1), self._iter_parallel(workers, read_batches))
+        else:
+            batches = self._iter_sequential(read_batches)
+        
+        total_records = 0
+        
+        for batch in batches:
+            total_records += len(batch)
+            yield batch
+        
+        logger.info("Pipeline complete. Total records ingested: %s", total_records)
+    
+    def _worker_count(self) -> int:
+        """Number of sources to drain at once, at least 1"""
+        return min(len(self.sources), self.parallel_workers or 1)
+    
+    def _record_chunks(self, source: DataSource) -> Iterator[List[Dict[str, Any]]]:
+        """Group a source's records into lists of batch_size
+        
+        Args:
+            source: DataSource to read
+            
+        Yields:
+            List of record dictionaries
         """
-        all_records = []
+        records = source.ingest()
         
-        logger.info(f"Starting ingestion pipeline with {len(self.sources)} sources")
+        while True:
+            chunk = list(islice(records, self.batch_size))
+            if not chunk:
+                break
+            yield chunk
+    
+    def _iter_sequential(self, produce: Callable[[DataSource], Iterator[Any]]) -> Iterator[Any]:
+        """Drain sources one after another in the calling thread
         
+        Args:
+            produce: Reads one source, e.g. methodcaller("ingest")
+            
+        Yields:
+            Items produced by each source in turn
+        """
         for idx, source in enumerate(self.sources, start=1):
-            logger.info(f"Processing source {idx}/{len(self.sources)}: {source.__class__.__name__}")
+            logger.info(
+                "Processing source %s/%s: %s",
+                idx, len(self.sources), source.__class__.__name__
+            )
             
             try:
-                for record in source.ingest():
-                    all_records.append(record)
+                yield from produce(source)
                 
                 stats = source.get_stats()
-                logger.info(f"Source {idx} complete: {stats}")
+                logger.info("Source %s complete: %s", idx, stats)
                 
             except IngestionError as e:
-                logger.error(f"Source {idx} failed: {e}")
+                logger.error("Source %s failed: %s", idx, e)
+                continue
+    
+    def _iter_parallel(
+        self,
+        workers: int,
+        produce: Callable[[DataSource], Iterator[Any]]
+    ) -> Iterator[Any]:
+        """Drain sources on a thread pool and merge their output
+        
+        Args:
+            workers: Number of worker threads
+            produce: Reads one source into batches, e.g. _record_chunks
+            
+        Yields:
+            Tuple of (1-based source position, batch) in hand-off order
+        """
+        # Bounded so fast sources cannot run far ahead of the consumer
+        handoff = queue.Queue(maxsize=workers * 4)
+        stop = threading.Event()
+        pending = len(self.sources)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for idx, source in enumerate(self.sources, start=1):
+                executor.submit(self._drain, idx, source, produce, handoff, stop)
+            
+            try:
+                while pending:
+                    item = handoff.get()
+                    
+                    if item is self._DONE:
+                        pending -= 1
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                # Unblock workers if the consumer stops early
+                stop.set()
+    
+    def _drain(
+        self,
+        idx: int,
+        source: DataSource,
+        produce: Callable[[DataSource], Iterator[Any]],
+        handoff: queue.Queue,
+        stop: threading.Event
+    ) -> None:
+        """Push a source's batches onto the hand-off queue
+        
+        Args:
+            idx: 1-based position of the source in the pipeline
+            source: DataSource to drain
+            produce: Reads the source into batches
+            handoff: Queue shared with the consuming generator
+            stop: Set when the consumer has stopped reading
+        """
+        logger.info(
+            "Processing source %s/%s: %s",
+            idx, len(self.sources), source.__class__.__name__
+        )
+        
+        try:
+            for batch in produce(source):
+                if not self._put(handoff, (idx, batch), stop):
+                    return
+            
+            stats = source.get_stats()
+            logger.info("Source %s complete: %s", idx, stats)
+            
+        except IngestionError as e:
+            logger.error("Source %s failed: %s", idx, e)
+            
+        except Exception as e:
+            self._put(handoff, e, stop)
+            
+        finally:
+            self._put(handoff, self._DONE, stop)
+    
+    @staticmethod
+    def _put(handoff: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """Put an item on the queue unless the consumer has stopped
+        
+        Returns:
+            True if the item was queued
+        """
+        while not stop.is_set():
+            try:
+                handoff.put(item, timeout=0.1)
+                return True
+            except queue.Full:
                 continue
         
-        logger.info(f"Pipeline complete. Total records ingested: {len(all_records)}")
-        return all_records
+        return False
+    
+    def run(self) -> List[Dict[str, Any]]:
+        """Run the ingestion pipeline
+        
+        Prefer iter_run() for large inputs; this materializes every record.
+        Sources are still drained concurrently, but the records are returned
+        grouped by source in the order the sources were added.
+        
+        Returns:
+            List of all ingested records
+        """
+        workers = self._worker_count()
+        
+        if workers <= 1:
+            return list(self.iter_run())
+        
+        logger.info("Starting ingestion pipeline with %s sources", len(self.sources))
+        
+        by_source = [[] for _ in self.sources]
+        
+        for idx, chunk in self._iter_parallel(workers, self._record_chunks):
+            by_source[idx - 1].extend(chunk)
+        
+        records = list(chain.from_iterable(by_source))
+        logger.info("Pipeline complete. Total records ingested: %s", len(records))
+        return records
@@ -4,20 +4,39 @@ Provides structured logging setup with file rotation,
 console output, and different log levels per environment.
 """
 
+import atexit
+import json
 import logging
 import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
+import uuid
+import weakref
+from collections import Counter, deque
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import List, Optional
+from datetime import datetime, timedelta
 
-from src.config_manager import ConfigManager
+from src.config_manager import ConfigManager, ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib JSON encoder
+    orjson = None
+
+_EPOCH = datetime(1970, 1, 1)
 
 
 class LoggerSetup:
     """Configure and manage application logging"""
     
     _loggers = {}
+    _listeners = {}
+    _listeners_registered = False
     
     @classmethod
     def setup_logging(cls, config: ConfigManager, name: str = "pipeline") -> logging.Logger:
@@ -39,15 +58,30 @@ class LoggerSetup:
         # Remove existing handlers
         logger.handlers.clear()
         
+        handlers = []
+        
         # Setup console handler
         if config.get("logging.console.enabled", True):
-            console_handler = cls._create_console_handler(config)
-            logger.addHandler(console_handler)
+            handlers.append(cls._create_console_handler(config))
         
         # Setup file handler
         if config.get("logging.file.enabled", True):
-            file_handler = cls._create_file_handler(config)
-            logger.addHandler(file_handler)
+            handlers.append(cls._create_file_handler(config))
+        
+        # Hand records to a background listener so callers never block on I/O
+        if handlers:
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            listener.start()
+            
+            if not cls._listeners_registered:
+                atexit.register(cls.shutdown)
+                cls._listeners_registered = True
+            cls._listeners[name] = listener
+            
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
         
         # Prevent propagation to root logger
         logger.propagate = False
@@ -120,11 +154,59 @@ class LoggerSetup:
         Returns:
             Log formatter
         """
-        format_string = config.get(
+        return logging.Formatter(cls._get_format(config))
+    
+    @classmethod
+    def _get_format(cls, config: ConfigManager) -> str:
+        """Get log format string from config
+        
+        Args:
+            config: Configuration manager
+            
+        Returns:
+            Log format string
+        """
+        return config.get(
             "logging.format",
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
-        return logging.Formatter(format_string)
+    
+    @classmethod
+    def get_handlers(cls, name: str) -> List[logging.Handler]:
+        """Get the output handlers serving a configured logger
+        
+        Args:
+            name: Logger name
+            
+        Returns:
+            Handlers owned by the logger's queue listener
+        """
+        listener = cls._listeners.get(name)
+        return list(listener.handlers) if listener else []
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop queue listeners, flushing any pending log records
+        
+        The loggers' queue handlers are removed as well and propagation is
+        restored, so records logged afterwards reach the root logger instead
+        of a queue nobody drains.
+        """
+        for name, listener in cls._listeners.items():
+            logger = cls._loggers.get(name)
+            
+            if logger is not None:
+                for handler in list(logger.handlers):
+                    if isinstance(handler, logging.handlers.QueueHandler):
+                        logger.removeHandler(handler)
+                logger.propagate = True
+            
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        
+        cls._listeners.clear()
+        cls._loggers.clear()
     
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
@@ -141,20 +223,234 @@ class LoggerSetup:
         return logging.getLogger(name)
 
 
+class ErrorLog(Sequence):
+    """Bounded error details stored as one tuple per entry
+    
+    Logging an error appends a single tuple instead of building a dict, and
+    that append is atomic, so concurrent log_error() calls can never mix the
+    fields of different errors. Entries are materialized as dicts only when
+    read back; reads, slices and == behave like the list of those dicts.
+    """
+    
+    FIELDS = ("timestamp", "context", "error_type", "error_message", "record")
+    
+    def __init__(self, maxlen: Optional[int] = None):
+        """Initialize the error log
+        
+        Args:
+            maxlen: Most entries kept; older ones are dropped first
+        """
+        self._entries = deque(maxlen=maxlen)
+    
+    def add(
+        self,
+        timestamp: str,
+        context: str,
+        error_type: str,
+        error_message: str,
+        record: Optional[dict]
+    ) -> None:
+        """Add an error from its fields, dropping the oldest one when full"""
+        self._entries.append((timestamp, context, error_type, error_message, record))
+    
+    def append(self, error_info: dict) -> None:
+        """Add an error given as a dict; keys outside FIELDS are not kept"""
+        self._entries.append(tuple(map(error_info.get, self.FIELDS)))
+    
+    def clear(self) -> None:
+        """Drop every entry"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [dict(zip(self.FIELDS, entry)) for entry in list(self._entries)[index]]
+        return dict(zip(self.FIELDS, self._entries[index]))
+    
+    def __iter__(self):
+        # Copy first; a deque raises if another thread appends mid-iteration
+        return (dict(zip(self.FIELDS, entry)) for entry in list(self._entries))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ErrorLog, list)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+
+
+class _QuarantineWriter:
+    """Background thread appending quarantined records to a JSON lines file
+    
+    Holds no reference to its ErrorTracker, so the tracker can be garbage
+    collected while the thread runs; the tracker's finalizer closes it.
+    """
+    
+    # Tells the writer thread to finish
+    _STOP = object()
+    
+    def __init__(self, file_path: Path, logger: logging.Logger, batch_size: int):
+        """Start the writer thread
+        
+        Args:
+            file_path: Quarantine file to append to
+            logger: Logger for write failures
+            batch_size: Most records encoded per disk write
+        """
+        self.file_path = file_path
+        self.logger = logger
+        self.batch_size = batch_size
+        self.pending = queue.Queue()
+        
+        # Quarantined records the thread could not encode or write
+        self.failures = 0
+        
+        self.thread = threading.Thread(target=self._run, name="quarantine-writer", daemon=True)
+        self.thread.start()
+    
+    def _run(self) -> None:
+        """Drain queued records into the quarantine file until stopped
+        
+        Every available record (up to batch_size) is encoded and written
+        with a single flush. Records that cannot be encoded or written are
+        logged and counted in failures; the thread keeps draining the queue
+        so flush() and close() never block on it.
+        """
+        pending = self.pending
+        file_path = self.file_path
+        
+        try:
+            quarantine_file = open(file_path, 'ab', buffering=1 << 20)
+        except OSError as e:
+            self.logger.error("Failed to open quarantine file %s: %s", file_path, e)
+            quarantine_file = None
+        
+        stopping = False
+        
+        try:
+            while not stopping:
+                batch = [pending.get()]
+                
+                try:
+                    while len(batch) < self.batch_size:
+                        batch.append(pending.get_nowait())
+                except queue.Empty:
+                    pass
+                
+                try:
+                    lines = []
+                    
+                    for item in batch:
+                        if item is self._STOP:
+                            stopping = True
+                            continue
+                        
+                        try:
+                            lines.append(ErrorTracker._encode_quarantine(*item))
+                        except Exception as e:
+                            self.failures += 1
+                            self.logger.error("Failed to quarantine record: %s", e)
+                    
+                    if lines and quarantine_file is None:
+                        self.failures += len(lines)
+                    elif lines:
+                        try:
+                            quarantine_file.write(b"".join(lines))
+                            quarantine_file.flush()
+                        except OSError as e:
+                            self.failures += len(lines)
+                            self.logger.error("Failed to write quarantine file %s: %s", file_path, e)
+                
+                finally:
+                    for _ in batch:
+                        pending.task_done()
+        
+        finally:
+            if quarantine_file is not None:
+                try:
+                    quarantine_file.close()
+                except OSError as e:
+                    self.logger.error("Failed to close quarantine file %s: %s", file_path, e)
+    
+    def close(self) -> None:
+        """Write outstanding records and stop the thread"""
+        self.pending.put(self._STOP)
+        self.thread.join()
+
+
 class ErrorTracker:
     """Track and report errors during pipeline execution"""
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    # Most quarantined records the background writer encodes per disk write
+    QUARANTINE_BATCH_SIZE = 1000
+    
+    # Most recent error and warning details kept in memory; older ones are only counted
+    MAX_TRACKED_ERRORS = 10_000
+    
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        config: Optional[ConfigManager] = None
+    ):
         """Initialize error tracker
         
         Args:
             logger: Logger instance for error reporting
+            config: Configuration manager (optional), read for
+                error_handling.max_tracked_errors
         """
         self.logger = logger or logging.getLogger(__name__)
-        self.errors = []
-        self.warnings = []
+        max_tracked = (
+            config.get("error_handling.max_tracked_errors", self.MAX_TRACKED_ERRORS)
+            if config else self.MAX_TRACKED_ERRORS
+        )
+        
+        # None keeps every detail; 0 would silently discard them all
+        if max_tracked is not None and (
+            isinstance(max_tracked, bool)
+            or not isinstance(max_tracked, int)
+            or max_tracked < 1
+        ):
+            raise ConfigurationError(
+                f"error_handling.max_tracked_errors must be a positive integer or null, got {max_tracked!r}"
+            )
+        self.errors = ErrorLog(maxlen=max_tracked)
+        self.error_type_counts = Counter()
+        self.error_count = 0
+        self.warnings = deque(maxlen=max_tracked)
+        self.warning_count = 0
         self.quarantine_path = Path("data/quarantine")
         self.quarantine_path.mkdir(parents=True, exist_ok=True)
+        self._quarantine_file_path = None
+        self._quarantine_writer = None
+        self._quarantine_finalizer = None
+        self._quarantine_lock = threading.Lock()
+        
+        # Guards the running counters; sources may log from parallel workers
+        self._count_lock = threading.Lock()
+        
+        # Failures counted by writers that have already been closed
+        self._closed_quarantine_failures = 0
+        
+        # Last formatted timestamp, reused for events in the same millisecond
+        self._last_ts_ns = 0
+        self._last_ts_str = ""
+    
+    def _now_iso(self) -> str:
+        """Current UTC time as an ISO string, formatted at most once per millisecond
+        
+        Returns:
+            ISO 8601 timestamp
+        """
+        now_ns = time.time_ns()
+        
+        if now_ns - self._last_ts_ns >= 1_000_000:
+            self._last_ts_str = (_EPOCH + timedelta(microseconds=now_ns // 1000)).isoformat()
+            self._last_ts_ns = now_ns
+        
+        return self._last_ts_str
     
     def log_error(self, error: Exception, context: str, record: Optional[dict] = None) -> None:
         """Log an error with context
@@ -164,17 +460,14 @@ class ErrorTracker:
             context: Context where error occurred
             record: Optional data record that caused the error
         """
-        error_info = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "context": context,
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            "record": record
-        }
+        error_type = type(error).__name__
         
-        self.errors.append(error_info)
+        self.errors.add(self._now_iso(), context, error_type, str(error), record)
+        with self._count_lock:
+            self.error_type_counts[error_type] += 1
+            self.error_count += 1
         self.logger.error(
-            f"{context}: {type(error).__name__} - {error}",
+            "%s: %s - %s", context, error_type, error,
             extra={"record": record},
             exc_info=True
         )
@@ -187,63 +480,131 @@ class ErrorTracker:
             context: Context where warning occurred
         """
         warning_info = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._now_iso(),
             "context": context,
             "message": message
         }
         
         self.warnings.append(warning_info)
-        self.logger.warning(f"{context}: {message}")
+        with self._count_lock:
+            self.warning_count += 1
+        self.logger.warning("%s: %s", context, message)
     
     def quarantine_record(self, record: dict, reason: str) -> None:
         """Move failed record to quarantine
         
+        Records are handed to a background writer thread, which appends
+        them in batches as JSON lines to one file per tracker; call flush()
+        or close() to wait until they are on disk. Queued records are also
+        written when the tracker is garbage collected or the interpreter exits.
+        
         Args:
             record: Data record that failed
             reason: Reason for quarantine
         """
-        import json
+        with self._quarantine_lock:
+            if self._quarantine_writer is None:
+                self._start_quarantine_writer()
+            
+            self._quarantine_writer.pending.put((self._now_iso(), reason, record))
+            file_path = self._quarantine_file_path
         
+        self.logger.info("Record quarantined: %s", file_path)
+    
+    def _start_quarantine_writer(self) -> None:
+        """Start the background thread that writes quarantined records
+        
+        Must be called with _quarantine_lock held. Each writer gets its own
+        file, named with the pid and a random suffix so trackers started in
+        the same second never share one.
+        """
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        source = record.get("_source", "unknown")
-        filename = f"{source}_{timestamp}_{len(self.errors)}.json"
+        suffix = f"{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        self._quarantine_file_path = self.quarantine_path / f"quarantine_{timestamp}_{suffix}.jsonl"
         
-        quarantine_file = self.quarantine_path / filename
+        writer = _QuarantineWriter(
+            self._quarantine_file_path, self.logger, self.QUARANTINE_BATCH_SIZE
+        )
+        self._quarantine_writer = writer
         
+        # Daemon threads are killed at exit, so drain the queue first; the
+        # finalizer only holds the writer, so the tracker can still be collected
+        self._quarantine_finalizer = weakref.finalize(self, writer.close)
+    
+    @property
+    def quarantine_failures(self) -> int:
+        """Quarantined records that could not be encoded or written"""
+        writer = self._quarantine_writer
+        current = writer.failures if writer is not None else 0
+        return self._closed_quarantine_failures + current
+    
+    @staticmethod
+    def _encode_quarantine(timestamp: str, reason: str, record: dict) -> bytes:
+        """Encode a quarantined record as one JSON line
+        
+        Args:
+            timestamp: Time the record was quarantined
+            reason: Reason for quarantine
+            record: Data record that failed
+            
+        Returns:
+            UTF-8 JSON line including the trailing newline
+        """
         quarantine_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "reason": reason,
             "record": record
         }
         
-        with open(quarantine_file, 'w') as f:
-            json.dump(quarantine_data, f, indent=2)
+        if orjson is not None:
+            return orjson.dumps(quarantine_data, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        return json.dumps(quarantine_data, default=str).encode() + b"\n"
+    
+    def flush(self) -> None:
+        """Wait until every quarantined record has been written to disk"""
+        writer = self._quarantine_writer
         
-        self.logger.info(f"Record quarantined: {filename}")
+        if writer is not None:
+            writer.pending.join()
+    
+    def close(self) -> None:
+        """Write outstanding quarantined records and stop the writer thread"""
+        with self._quarantine_lock:
+            if self._quarantine_writer is None:
+                return
+            
+            # Runs writer.close() once and drops the exit hook
+            self._quarantine_finalizer()
+            self._closed_quarantine_failures += self._quarantine_writer.failures
+            self._quarantine_writer = None
+            self._quarantine_finalizer = None
     
     def get_error_summary(self) -> dict:
         """Get summary of errors and warnings
         
+        Totals and per-type counts are kept as running counters, so the
+        summary never rescans the tracked errors and covers every error
+        logged even after the oldest details have been dropped.
+        
         Returns:
             Dictionary with error statistics
         """
-        error_types = {}
-        for error in self.errors:
-            error_type = error["error_type"]
-            error_types[error_type] = error_types.get(error_type, 0) + 1
-        
         return {
-            "total_errors": len(self.errors),
-            "total_warnings": len(self.warnings),
-            "error_types": error_types,
-            "errors": self.errors,
-            "warnings": self.warnings
+            "total_errors": self.error_count,
+            "total_warnings": self.warning_count,
+            "error_types": dict(self.error_type_counts),
+            "errors": list(self.errors),
+            "warnings": list(self.warnings)
         }
     
     def clear(self) -> None:
         """Clear all tracked errors and warnings"""
-        self.errors.clear()
-        self.warnings.clear()
+        with self._count_lock:
+            self.errors.clear()
+            self.error_type_counts.clear()
+            self.error_count = 0
+            self.warnings.clear()
+            self.warning_count = 0
 
 
 def setup_pipeline_logger(config: ConfigManager) -> logging.Logger:
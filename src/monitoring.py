@@ -4,47 +4,322 @@ Tracks pipeline execution metrics including success rates,
 processing times, error counts, and throughput.
 """
 
+import functools
+import operator
 import time
 import json
-from datetime import datetime
+import sys
+import threading
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from collections import defaultdict, deque, namedtuple
+from itertools import islice
 import logging
 
+import numpy as np
+
+from src.config_manager import ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib JSON encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
 
-class MetricsCollector:
-    """Collect and aggregate pipeline metrics"""
+# Raw event records; the first field is always the time.time_ns() stamp
+PipelineStartEvent = namedtuple("PipelineStartEvent", "timestamp_ns start_time")
+PipelineCompletionEvent = namedtuple(
+    "PipelineCompletionEvent", "timestamp_ns end_time duration_seconds"
+)
+ValidationEvent = namedtuple("ValidationEvent", "timestamp_ns valid error_count")
+QualityScoreEvent = namedtuple("QualityScoreEvent", "timestamp_ns score")
+
+
+@functools.lru_cache(maxsize=64)
+def _iso_second(seconds: int) -> str:
+    """Format whole seconds since the epoch as an ISO string
+    
+    Args:
+        seconds: Seconds since the epoch
+        
+    Returns:
+        ISO 8601 timestamp without a fractional part
+    """
+    return (_EPOCH + timedelta(seconds=seconds)).isoformat()
+
+
+def _iso_from_ns(timestamp_ns: int) -> str:
+    """Format a UTC epoch timestamp in nanoseconds as an ISO string
+    
+    Events cluster within the same second, so the date and time part is
+    cached per second and only the microseconds are formatted per call.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch, as from time.time_ns()
+        
+    Returns:
+        ISO 8601 timestamp with microsecond precision
+    """
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    microseconds = remainder // 1000
+    
+    # Match datetime.isoformat(), which omits a zero fraction
+    if microseconds:
+        return f"{_iso_second(seconds)}.{microseconds:06d}"
+    return _iso_second(seconds)
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as JSON bytes, using orjson when available
+    
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+class LevelAggregator:
+    """Pre-aggregate metrics into per-minute and per-hour buckets
+    
+    The last RETAIN_MINUTES minutes before the newest event stay at minute
+    resolution; older minutes are rolled up into hour buckets. A window
+    query merges at most RETAIN_MINUTES minute buckets plus one bucket per
+    hour instead of raw events, and windows that fit within the retained
+    minutes are exact to the minute.
+    """
+    
+    MINUTE = 60
+    HOUR = 3600
+    RETAIN_MINUTES = 60
+    FIELDS = (
+        "sum_duration", "count", "success_count",
+        "validation_count", "valid_count", "quality_sum", "quality_count"
+    )
     
     def __init__(self):
-        """Initialize metrics collector"""
-        self.metrics = defaultdict(list)
+        """Initialize empty bucket levels"""
+        self.minute_buckets: Dict[int, Dict[str, float]] = {}
+        self.hour_buckets: Dict[int, Dict[str, float]] = {}
+        
+        # Newest minute seen; minutes before _rolled_until live in hour buckets
+        self._newest_minute = None
+        self._rolled_until = None
+    
+    def add(self, timestamp: float, **values: float) -> None:
+        """Add values to the minute bucket containing a timestamp
+        
+        Args:
+            timestamp: Event time in seconds since the epoch
+            **values: Amounts to add, keyed by names from FIELDS
+        """
+        minute = int(timestamp // self.MINUTE)
+        if self._newest_minute is None or minute > self._newest_minute:
+            self._newest_minute = minute
+            self._roll_up(minute - self.RETAIN_MINUTES)
+        
+        if minute < self._rolled_until:
+            # Late event for a minute that was already rolled up
+            buckets, key = self.hour_buckets, minute * self.MINUTE // self.HOUR
+        else:
+            buckets, key = self.minute_buckets, minute
+        
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = dict.fromkeys(self.FIELDS, 0)
+        
+        for field, value in values.items():
+            bucket[field] += value
+    
+    def _roll_up(self, cutoff: int) -> None:
+        """Close minute buckets before a cutoff minute into hour buckets
+        
+        Args:
+            cutoff: First minute index kept at minute resolution
+        """
+        minutes_per_hour = self.HOUR // self.MINUTE
+        
+        for minute in [m for m in self.minute_buckets if m < cutoff]:
+            bucket = self.minute_buckets.pop(minute)
+            target = self.hour_buckets.setdefault(
+                minute // minutes_per_hour, dict.fromkeys(self.FIELDS, 0)
+            )
+            for field, value in bucket.items():
+                target[field] += value
+        
+        self._rolled_until = cutoff
+    
+    def query(self, start: float) -> Dict[str, float]:
+        """Merge all buckets overlapping the window from start until now
+        
+        Hour buckets only hold minutes older than the retained ones, so
+        they are merged only when the window reaches back past those.
+        
+        Args:
+            start: Window start in seconds since the epoch
+            
+        Returns:
+            Dictionary with the summed FIELDS for the window
+        """
+        totals = dict.fromkeys(self.FIELDS, 0)
+        levels = [(self.minute_buckets, self.MINUTE)]
+        
+        if self._rolled_until is not None and start < self._rolled_until * self.MINUTE:
+            levels.append((self.hour_buckets, self.HOUR))
+        
+        for buckets, width in levels:
+            for key, bucket in buckets.items():
+                if (key + 1) * width > start:
+                    for field, value in bucket.items():
+                        totals[field] += value
+        
+        return totals
+
+
+class _MetricsView(Mapping):
+    """Read-only live view of a collector's raw events by metric name
+    
+    Events are formatted into dictionaries when a metric is read, and each
+    metric reads back as a tuple, oldest event first.
+    """
+    
+    __slots__ = ("_collector",)
+    
+    def __init__(self, collector: "MetricsCollector"):
+        self._collector = collector
+    
+    def __getitem__(self, name: str) -> Tuple[Dict[str, Any], ...]:
+        for metric, events in self._collector._iter_metrics():
+            if metric == name:
+                return tuple(events)
+        raise KeyError(name)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter([name for name, _ in self._collector._iter_metrics()])
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self._collector._iter_metrics())
+
+
+class _SourceMetricsView(Mapping):
+    """Read-only live view of a collector's per-source totals"""
+    
+    __slots__ = ("_collector",)
+    
+    def __init__(self, collector: "MetricsCollector"):
+        self._collector = collector
+    
+    def __getitem__(self, source: str) -> Mapping:
+        with self._collector._lock:
+            return MappingProxyType(self._collector._source_totals()[source])
+    
+    def __iter__(self) -> Iterator[str]:
+        with self._collector._lock:
+            return iter(list(self._collector._source_names))
+    
+    def __len__(self) -> int:
+        return len(self._collector._source_names)
+
+
+class MetricsCollector:
+    """Collect and aggregate pipeline metrics
+    
+    Raw events are stored as namedtuples and NumPy arrays, and per-source
+    totals as arrays indexed by source id; metrics and source_metrics are
+    read-only mapping views over them.
+    """
+    
+    # Raw events encoded per write, and write buffer size for exports
+    EXPORT_CHUNK_SIZE = 4096
+    EXPORT_BUFFER_SIZE = 32768
+    
+    def __init__(self, max_event_log: Optional[int] = 10_000):
+        """Initialize metrics collector
+        
+        Args:
+            max_event_log: Most recent raw events kept per metric, or None to
+                keep every event; summaries use running totals and are
+                unaffected by this limit
+        """
+        self.max_event_log = max_event_log
+        self._events = defaultdict(lambda: deque(maxlen=self.max_event_log))
         self.start_time = None
         self.end_time = None
+        self._start_mono = None
+        self._duration = 0.0
         self.records_processed = 0
         self.records_failed = 0
-        self.source_metrics = defaultdict(dict)
+        
+        # Ingestion events as parallel arrays, used as a ring buffer
+        self._ing_capacity = 0
+        self._ing_source = np.empty(0, dtype=np.int32)
+        self._ing_duration = np.empty(0, dtype=np.float64)
+        self._ing_success = np.empty(0, dtype=np.bool_)
+        self._ing_timestamp = np.empty(0, dtype=np.int64)
+        
+        # Interned source names and per-source totals indexed by source id
+        self._source_ids: Dict[str, int] = {}
+        self._source_names: List[str] = []
+        self._src_success = np.zeros(0, dtype=np.int64)
+        self._src_failure = np.zeros(0, dtype=np.int64)
+        self._src_duration = np.zeros(0, dtype=np.float64)
+        
+        # Last source seen; batches usually repeat the same name object
+        self._last_source = None
+        self._last_source_id = -1
+        
+        # Running aggregates so get_summary() never rescans raw events
+        self._sum_ingestion_duration = 0.0
+        self._ingestion_count = 0
+        self._valid_count = 0
+        self._validation_count = 0
+        self._sum_quality = 0.0
+        self._quality_count = 0
+        
+        # Time-bucketed aggregates for recent-window health checks
+        self.aggregator = LevelAggregator()
+        
+        # Guards every mutation and snapshot so concurrent workers can share one collector
+        self._lock = threading.Lock()
+        
+        self.metrics = _MetricsView(self)
+        self.source_metrics = _SourceMetricsView(self)
     
     def start_pipeline(self) -> None:
         """Mark pipeline start"""
-        self.start_time = time.time()
-        self.metrics["pipeline_starts"].append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "start_time": self.start_time
-        })
+        # Wall clock for display, monotonic clock for the duration
+        with self._lock:
+            self.start_time = time.time()
+            self._start_mono = time.perf_counter()
+            self._events["pipeline_starts"].append(
+                PipelineStartEvent(time.time_ns(), self.start_time)
+            )
     
     def end_pipeline(self) -> None:
         """Mark pipeline end"""
-        self.end_time = time.time()
-        duration = self.end_time - self.start_time if self.start_time else 0
-        
-        self.metrics["pipeline_completions"].append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "end_time": self.end_time,
-            "duration_seconds": duration
-        })
+        with self._lock:
+            self.end_time = time.time()
+            if self._start_mono is not None:
+                self._duration = time.perf_counter() - self._start_mono
+            
+            self._events["pipeline_completions"].append(
+                PipelineCompletionEvent(time.time_ns(), self.end_time, self._duration)
+            )
     
     def record_ingestion(self, source: str, success: bool, duration: float = 0) -> None:
         """Record ingestion metrics
@@ -54,34 +329,182 @@ class MetricsCollector:
             success: Whether ingestion succeeded
             duration: Time taken in seconds
         """
-        if success:
-            self.records_processed += 1
-        else:
-            self.records_failed += 1
+        now_ns = time.time_ns()
         
-        self.metrics["ingestions"].append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "source": source,
-            "success": success,
-            "duration_seconds": duration
-        })
-        
-        # Update source-specific metrics
-        if source not in self.source_metrics:
-            self.source_metrics[source] = {
-                "success_count": 0,
-                "failure_count": 0,
-                "total_duration": 0,
-                "record_count": 0
+        with self._lock:
+            source_id = self._intern_source(source)
+            
+            if success:
+                self.records_processed += 1
+                self._src_success[source_id] += 1
+            else:
+                self.records_failed += 1
+                self._src_failure[source_id] += 1
+            self._src_duration[source_id] += duration
+            
+            # Store the event in the next ring buffer slot; None never wraps
+            if self.max_event_log is None or self.max_event_log > 0:
+                slot = (
+                    self._ingestion_count if self.max_event_log is None
+                    else self._ingestion_count % self.max_event_log
+                )
+                if slot >= self._ing_capacity:
+                    self._grow_event_arrays()
+                self._ing_source[slot] = source_id
+                self._ing_duration[slot] = duration
+                self._ing_success[slot] = success
+                self._ing_timestamp[slot] = now_ns
+            
+            self._sum_ingestion_duration += duration
+            self._ingestion_count += 1
+            self.aggregator.add(
+                now_ns / 1e9,
+                sum_duration=duration,
+                count=1,
+                success_count=1 if success else 0
+            )
+    
+    def _intern_source(self, source: str) -> int:
+        """Map a source name to its integer id, registering new sources
+        
+        Must be called with the collector lock held. Names are interned,
+        and a repeat of the previous name object skips the dictionary.
+        
+        Args:
+            source: Data source name
+            
+        Returns:
+            Index of the source in the per-source arrays
+        """
+        if source is self._last_source:
+            return self._last_source_id
+        
+        source_id = self._source_ids.get(source)
+        
+        if source_id is None:
+            name = sys.intern(source)
+            source_id = self._source_ids[name] = len(self._source_names)
+            self._source_names.append(name)
+            
+            if source_id >= len(self._src_success):
+                size = max(2 * len(self._src_success), 8)
+                self._src_success = np.resize(self._src_success, size)
+                self._src_failure = np.resize(self._src_failure, size)
+                self._src_duration = np.resize(self._src_duration, size)
+                self._src_success[source_id:] = 0
+                self._src_failure[source_id:] = 0
+                self._src_duration[source_id:] = 0
+        
+        self._last_source = source
+        self._last_source_id = source_id
+        return source_id
+    
+    def _grow_event_arrays(self) -> None:
+        """Grow the ingestion event arrays geometrically up to max_event_log"""
+        capacity = max(2 * self._ing_capacity, 64)
+        if self.max_event_log is not None:
+            capacity = min(capacity, self.max_event_log)
+        
+        self._ing_source = np.resize(self._ing_source, capacity)
+        self._ing_duration = np.resize(self._ing_duration, capacity)
+        self._ing_success = np.resize(self._ing_success, capacity)
+        self._ing_timestamp = np.resize(self._ing_timestamp, capacity)
+        self._ing_capacity = capacity
+    
+    def _source_totals(self) -> Dict[str, Dict[str, Any]]:
+        """Build per-source totals; the caller must hold the collector lock
+        
+        Returns:
+            Dictionary mapping source name to its counts and total duration
+        """
+        count = len(self._source_names)
+        
+        return {
+            name: {
+                "success_count": success,
+                "failure_count": failure,
+                "total_duration": duration,
+                "record_count": success + failure
             }
+            for name, success, failure, duration in zip(
+                self._source_names,
+                self._src_success[:count].tolist(),
+                self._src_failure[:count].tolist(),
+                self._src_duration[:count].tolist()
+            )
+        }
+    
+    def _iter_metrics(self) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+        """Iterate metric names with lazily formatted event dictionaries
+        
+        Events are stored as namedtuples with integer nanosecond stamps and
+        only turned into dictionaries with ISO timestamps here, when they
+        are actually read or exported.
+        
+        Yields:
+            Tuple of (metric name, iterator over event dictionaries)
+        """
+        # Snapshot under the lock; formatting happens after it is released
+        with self._lock:
+            snapshot = [(name, list(events)) for name, events in self._events.items()]
+            ingestions = (
+                self._snapshot_ingestion_events()
+                if self._ingestion_count and self.max_event_log != 0 else None
+            )
+        
+        for name, events in snapshot:
+            yield name, (
+                {"timestamp": _iso_from_ns(event[0]), **dict(zip(event._fields[1:], event[1:]))}
+                for event in events
+            )
+        
+        if ingestions is not None:
+            yield "ingestions", self._iter_ingestion_events(*ingestions)
+    
+    def _snapshot_ingestion_events(self) -> Tuple[List[str], Tuple[list, list, list, list]]:
+        """Copy retained ingestion events out of the ring buffer in arrival order
+        
+        Must be called with the collector lock held.
+        
+        Returns:
+            Tuple of (source names, (source ids, successes, durations, timestamps))
+        """
+        count = self._ingestion_count
         
-        if success:
-            self.source_metrics[source]["success_count"] += 1
+        if self.max_event_log is None or count <= self.max_event_log:
+            order = np.arange(count)
         else:
-            self.source_metrics[source]["failure_count"] += 1
+            start = count % self.max_event_log
+            order = np.r_[start:self.max_event_log, 0:start]
+        
+        return list(self._source_names), (
+            self._ing_source[order].tolist(),
+            self._ing_success[order].tolist(),
+            self._ing_duration[order].tolist(),
+            self._ing_timestamp[order].tolist()
+        )
+    
+    @staticmethod
+    def _iter_ingestion_events(
+        names: List[str],
+        columns: Tuple[list, list, list, list]
+    ) -> Iterator[Dict[str, Any]]:
+        """Materialize ingestion events from a ring buffer snapshot
+        
+        Args:
+            names: Source names indexed by source id
+            columns: Parallel event columns from _snapshot_ingestion_events()
         
-        self.source_metrics[source]["total_duration"] += duration
-        self.source_metrics[source]["record_count"] += 1
+        Yields:
+            Ingestion event dictionaries in arrival order
+        """
+        for source_id, success, duration, timestamp_ns in zip(*columns):
+            yield {
+                "timestamp": _iso_from_ns(timestamp_ns),
+                "source": names[source_id],
+                "success": success,
+                "duration_seconds": duration
+            }
     
     def record_validation(self, valid: bool, errors: List[str] = None) -> None:
         """Record validation metrics
@@ -90,11 +513,20 @@ class MetricsCollector:
             valid: Whether validation passed
             errors: List of validation errors
         """
-        self.metrics["validations"].append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "valid": valid,
-            "error_count": len(errors) if errors else 0
-        })
+        now_ns = time.time_ns()
+        
+        with self._lock:
+            self._events["validations"].append(
+                ValidationEvent(now_ns, valid, len(errors) if errors else 0)
+            )
+            self._validation_count += 1
+            if valid:
+                self._valid_count += 1
+            self.aggregator.add(
+                now_ns / 1e9,
+                validation_count=1,
+                valid_count=1 if valid else 0
+            )
     
     def record_quality_score(self, score: float) -> None:
         """Record data quality score
@@ -102,10 +534,13 @@ class MetricsCollector:
         Args:
             score: Quality score (0-100)
         """
-        self.metrics["quality_scores"].append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "score": score
-        })
+        now_ns = time.time_ns()
+        
+        with self._lock:
+            self._events["quality_scores"].append(QualityScoreEvent(now_ns, score))
+            self._sum_quality += score
+            self._quality_count += 1
+            self.aggregator.add(now_ns / 1e9, quality_sum=score, quality_count=1)
     
     def get_summary(self) -> Dict[str, Any]:
         """Get metrics summary
@@ -113,29 +548,49 @@ class MetricsCollector:
         Returns:
             Dictionary with aggregated metrics
         """
-        duration = (self.end_time - self.start_time) if (self.start_time and self.end_time) else 0
+        with self._lock:
+            return self._build_summary()
+    
+    def query_window(self, start: float) -> Dict[str, float]:
+        """Sum the time-bucketed aggregates from start until now
+        
+        Args:
+            start: Window start in seconds since the epoch
+            
+        Returns:
+            Dictionary with the summed aggregator fields for the window
+        """
+        with self._lock:
+            return self.aggregator.query(start)
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        """Build the metrics summary; the caller must hold the collector lock
+        
+        Returns:
+            Dictionary with aggregated metrics
+        """
+        duration = self._duration if (self.start_time and self.end_time) else 0
         
         # Calculate success rate
         total_records = self.records_processed + self.records_failed
         success_rate = (self.records_processed / total_records * 100) if total_records > 0 else 0
         
         # Calculate average processing time
-        ingestions = self.metrics.get("ingestions", [])
         avg_duration = (
-            sum(i["duration_seconds"] for i in ingestions) / len(ingestions)
-            if ingestions else 0
+            self._sum_ingestion_duration / self._ingestion_count
+            if self._ingestion_count else 0
         )
         
         # Calculate validation metrics
-        validations = self.metrics.get("validations", [])
-        valid_count = sum(1 for v in validations if v["valid"])
-        validation_rate = (valid_count / len(validations) * 100) if validations else 0
+        validation_rate = (
+            self._valid_count / self._validation_count * 100
+            if self._validation_count else 0
+        )
         
         # Calculate average quality score
-        quality_scores = self.metrics.get("quality_scores", [])
         avg_quality = (
-            sum(q["score"] for q in quality_scores) / len(quality_scores)
-            if quality_scores else 0
+            self._sum_quality / self._quality_count
+            if self._quality_count else 0
         )
         
         return {
@@ -150,41 +605,72 @@ class MetricsCollector:
                 "success_rate_percent": round(success_rate, 2)
             },
             "ingestion": {
-                "total_ingestions": len(ingestions),
+                "total_ingestions": self._ingestion_count,
                 "average_duration_seconds": round(avg_duration, 4),
-                "source_breakdown": dict(self.source_metrics)
+                "source_breakdown": self._source_totals()
             },
             "validation": {
-                "total_validations": len(validations),
-                "valid_count": valid_count,
+                "total_validations": self._validation_count,
+                "valid_count": self._valid_count,
                 "validation_rate_percent": round(validation_rate, 2)
             },
             "quality": {
                 "average_score": round(avg_quality, 2),
-                "total_scores_recorded": len(quality_scores)
+                "total_scores_recorded": self._quality_count
             }
         }
     
     def export_metrics(self, filepath: str) -> None:
         """Export metrics to JSON file
         
+        The summary is written first, then each raw metric list is streamed
+        in chunks of EXPORT_CHUNK_SIZE events through a buffered file, so
+        the whole event history is never encoded in one piece.
+        
         Args:
             filepath: Path to export file
         """
         summary = self.get_summary()
-        summary["raw_metrics"] = dict(self.metrics)
         
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filepath, 'w') as f:
-            json.dump(summary, f, indent=2)
+        with open(filepath, 'wb', buffering=self.EXPORT_BUFFER_SIZE) as f:
+            # Reopen the summary object so raw_metrics becomes its last key
+            head = _dumps(summary, indent=True)
+            f.write(head[:head.rindex(b"}")].rstrip())
+            f.write(b',\n  "raw_metrics": {')
+            
+            for idx, (name, events) in enumerate(self._iter_metrics()):
+                f.write(b',\n    ' if idx else b'\n    ')
+                f.write(_dumps(name) + b': [')
+                
+                separator = b'\n      '
+                events = iter(events)
+                while chunk := list(islice(events, self.EXPORT_CHUNK_SIZE)):
+                    # Encode the chunk as a list and drop its brackets
+                    f.write(separator + _dumps(chunk)[1:-1])
+                    separator = b',\n      '
+                
+                f.write(b'\n    ]')
+            
+            f.write(b'\n  }\n}\n')
         
-        logger.info(f"Metrics exported to {filepath}")
+        logger.info("Metrics exported to %s", filepath)
 
 
 class PipelineMonitor:
     """Monitor pipeline health and performance"""
     
+    # (metric, threshold key, breach test, severity, message template)
+    HEALTH_CHECKS = (
+        ("success_rate", "min_success_rate", operator.lt, "high",
+         "Success rate {value}% below threshold {threshold}%"),
+        ("avg_duration", "max_avg_duration", operator.gt, "medium",
+         "Average duration {value}s exceeds threshold {threshold}s"),
+        ("quality_score", "min_quality_score", operator.lt, "high",
+         "Quality score {value} below threshold {threshold}")
+    )
+    
     def __init__(self, config: Optional[Any] = None):
         """Initialize pipeline monitor
         
@@ -192,7 +678,18 @@ class PipelineMonitor:
             config: Configuration manager (optional)
         """
         self.config = config
-        self.metrics_collector = MetricsCollector()
+        max_event_log = config.get("monitoring.max_event_log", 10_000) if config else 10_000
+        
+        # None keeps every event; 0 would silently discard the event log
+        if max_event_log is not None and (
+            isinstance(max_event_log, bool)
+            or not isinstance(max_event_log, int)
+            or max_event_log < 1
+        ):
+            raise ConfigurationError(
+                f"monitoring.max_event_log must be a positive integer or null, got {max_event_log!r}"
+            )
+        self.metrics_collector = MetricsCollector(max_event_log=max_event_log)
         self.alerts = []
         self.thresholds = {
             "min_success_rate": 95.0,
@@ -200,47 +697,52 @@ class PipelineMonitor:
             "min_quality_score": 80.0
         }
     
-    def check_health(self) -> Dict[str, Any]:
+    def check_health(self, window_seconds: Optional[float] = None) -> Dict[str, Any]:
         """Check pipeline health against thresholds
         
+        Args:
+            window_seconds: Only consider events from the last N seconds
+                (at bucket granularity). If None, uses the whole run.
+        
         Returns:
             Health check results with status and issues
         """
         summary = self.metrics_collector.get_summary()
         issues = []
         
-        # Check success rate
-        success_rate = summary["records"]["success_rate_percent"]
-        if success_rate < self.thresholds["min_success_rate"]:
-            issues.append({
-                "severity": "high",
-                "metric": "success_rate",
-                "value": success_rate,
-                "threshold": self.thresholds["min_success_rate"],
-                "message": f"Success rate {success_rate}% below threshold {self.thresholds['min_success_rate']}%"
-            })
-        
-        # Check average processing time
-        avg_duration = summary["ingestion"]["average_duration_seconds"]
-        if avg_duration > self.thresholds["max_avg_duration"]:
-            issues.append({
-                "severity": "medium",
-                "metric": "avg_duration",
-                "value": avg_duration,
-                "threshold": self.thresholds["max_avg_duration"],
-                "message": f"Average duration {avg_duration}s exceeds threshold {self.thresholds['max_avg_duration']}s"
-            })
-        
-        # Check quality score
-        avg_quality = summary["quality"]["average_score"]
-        if avg_quality > 0 and avg_quality < self.thresholds["min_quality_score"]:
-            issues.append({
-                "severity": "high",
-                "metric": "quality_score",
-                "value": avg_quality,
-                "threshold": self.thresholds["min_quality_score"],
-                "message": f"Quality score {avg_quality} below threshold {self.thresholds['min_quality_score']}"
-            })
+        if window_seconds is None:
+            success_rate = summary["records"]["success_rate_percent"]
+            avg_duration = summary["ingestion"]["average_duration_seconds"]
+            avg_quality = summary["quality"]["average_score"]
+        else:
+            window = self.metrics_collector.query_window(time.time() - window_seconds)
+            count = window["count"]
+            success_rate = round(window["success_count"] / count * 100, 2) if count else 0
+            avg_duration = round(window["sum_duration"] / count, 4) if count else 0
+            avg_quality = (
+                round(window["quality_sum"] / window["quality_count"], 2)
+                if window["quality_count"] else 0
+            )
+        
+        values = {
+            "success_rate": success_rate,
+            "avg_duration": avg_duration,
+            # No quality scores recorded yet: nothing to check
+            "quality_score": avg_quality if avg_quality > 0 else None
+        }
+        
+        for metric, threshold_key, breached, severity, message in self.HEALTH_CHECKS:
+            value = values[metric]
+            threshold = self.thresholds[threshold_key]
+            
+            if value is not None and breached(value, threshold):
+                issues.append({
+                    "severity": severity,
+                    "metric": metric,
+                    "value": value,
+                    "threshold": threshold,
+                    "message": message.format(value=value, threshold=threshold)
+                })
         
         status = "healthy" if not issues else "degraded" if all(i["severity"] == "medium" for i in issues) else "unhealthy"
         
@@ -248,7 +750,8 @@ class PipelineMonitor:
             "status": status,
             "timestamp": datetime.utcnow().isoformat(),
             "issues": issues,
-            "summary": summary
+            "summary": summary,
+            "window_seconds": window_seconds
         }
         
         # Generate alerts for critical issues
@@ -274,7 +777,7 @@ class PipelineMonitor:
         }
         
         self.alerts.append(alert)
-        logger.warning(f"ALERT: {alert['message']}")
+        logger.warning("ALERT: %s", alert["message"])
     
     def get_alerts(self) -> List[Dict[str, Any]]:
         """Get all generated alerts
@@ -292,4 +795,4 @@ class PipelineMonitor:
             value: Threshold value
         """
         self.thresholds[metric] = value
-        logger.info(f"Threshold set: {metric} = {value}")
+        logger.info("Threshold set: %s = %s", metric, value)
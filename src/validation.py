@@ -3,18 +3,244 @@
 Validates data against predefined schemas to ensure structural integrity.
 """
 
+import copy
 import logging
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+import pandas as pd
 import yaml
 
 from src.config_manager import ConfigManager
+from src.validation_kernels import (
+    count_duplicate_codes,
+    count_duplicate_rows,
+    count_nulls_and_duplicates,
+    factorize_columns
+)
+
+try:
+    import re2
+except ImportError:  # Linear-time regex engine is optional
+    re2 = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
 
 
 logger = logging.getLogger(__name__)
 
+# Parsed schema files keyed by (resolved path, mtime in ns)
+_SCHEMA_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# Built-in type patterns, compiled once at import
+# Callers test for "@" first, a substring scan that rejects most bad values without the regex
+_EMAIL_RE = re.compile(r"^[^@]+@[^@]+\.[^@]+$")
+_PHONE_RE = re.compile(r"^\+?[\d\s\-\(\)]{10,}$")
+_URL_RE = re.compile(r"^https?://")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+# Numeric strings accepted without a row-wise int()/float() check
+_INT_STRING_RE = r"[+-]?\d+"
+_FLOAT_STRING_RE = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+
+
+def _compile_pattern(pattern: str):
+    """Compile a schema pattern, preferring the RE2 engine when available
+    
+    RE2 matches in linear time without backtracking, which keeps
+    user-supplied patterns safe and fast on large batches. Patterns RE2
+    cannot express (e.g. backreferences) fall back to the re module.
+    
+    Args:
+        pattern: Regular expression from the schema
+        
+    Returns:
+        Compiled pattern object with a match() method
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    
+    return re.compile(pattern)
+
+
+def _parses(convert, value: str) -> bool:
+    """Check whether a string converts cleanly with the given constructor"""
+    try:
+        convert(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+# Inline type checks for generated validators, matching _validate_type().
+# Regex checks call pre-bound match methods to skip the attribute lookup.
+_TYPE_CHECK_SOURCE = {
+    "string": "isinstance(v, str)",
+    "integer": "(_parses(int, v) if isinstance(v, str) else isinstance(v, int))",
+    "float": "(_parses(float, v) if isinstance(v, str) else isinstance(v, float))",
+    "boolean": "(v.lower() in _BOOL_STRINGS if isinstance(v, str) else isinstance(v, bool))",
+    "date": "(isinstance(v, str) and _match_date(v) is not None)",
+    "datetime": "(isinstance(v, str) and _match_date(v) is not None)",
+    "email": "(isinstance(v, str) and '@' in v and _match_email(v) is not None)",
+    "phone": "(isinstance(v, str) and _match_phone(v) is not None)",
+    "url": "(isinstance(v, str) and _match_url(v) is not None)"
+}
+
+
+def _build_field_validator(
+    fields: Dict[str, Any],
+    patterns: Dict[str, Any],
+    fail_fast: bool = False
+):
+    """Generate a straight-line field validation function for a schema
+    
+    Each field's type check and constraints are emitted as plain
+    comparisons against constants bound in the function's namespace, so
+    validating a record does no lookups into the field definitions.
+    Error messages match _validate_field().
+    
+    Args:
+        fields: Field definitions from the schema
+        patterns: Compiled patterns keyed by field name
+        fail_fast: Return right after the first error instead of checking
+            the remaining fields
+        
+    Returns:
+        Function validate_fields(record, errors) appending error messages
+    """
+    namespace = {
+        "_parses": _parses,
+        "_BOOL_STRINGS": frozenset({"true", "false", "1", "0"}),
+        "_match_email": _EMAIL_RE.match,
+        "_match_phone": _PHONE_RE.match,
+        "_match_url": _URL_RE.match,
+        "_match_date": _DATE_RE.match
+    }
+    lines = ["def validate_fields(record, errors):"]
+    
+    for idx, (name, field_def) in enumerate(fields.items()):
+        field_type = field_def["type"]
+        namespace[f"_n{idx}"] = name
+        namespace[f"_tm{idx}"] = (
+            f"Field '{name}' has invalid type. Expected {field_type}, got "
+        )
+        
+        lines.append(f"    if _n{idx} in record:")
+        lines.append(f"        v = record[_n{idx}]")
+        lines.append("        if v is None or v == '':")
+        if field_def.get("required", False):
+            namespace[f"_null{idx}"] = f"Field '{name}' is required but got null/empty"
+            lines.append(f"            errors.append(_null{idx})")
+        else:
+            lines.append("            pass")
+        lines.append(f"        elif not {_TYPE_CHECK_SOURCE[field_type]}:")
+        lines.append(f"            errors.append(_tm{idx} + type(v).__name__)")
+        
+        checks = []
+        
+        if field_type in ("integer", "float"):
+            if "min" in field_def:
+                namespace[f"_min{idx}"] = field_def["min"]
+                checks.append(f"if v < _min{idx}:")
+                checks.append(
+                    f"    errors.append(f\"Field '{{_n{idx}}}' value {{v}} "
+                    f"below minimum {{_min{idx}}}\")"
+                )
+            if "max" in field_def:
+                namespace[f"_max{idx}"] = field_def["max"]
+                checks.append(f"if v > _max{idx}:")
+                checks.append(
+                    f"    errors.append(f\"Field '{{_n{idx}}}' value {{v}} "
+                    f"above maximum {{_max{idx}}}\")"
+                )
+        
+        if field_type == "string":
+            if "min_length" in field_def:
+                namespace[f"_minlen{idx}"] = field_def["min_length"]
+                namespace[f"_short{idx}"] = (
+                    f"Field '{name}' too short (min: {field_def['min_length']})"
+                )
+                checks.append(f"if len(str(v)) < _minlen{idx}:")
+                checks.append(f"    errors.append(_short{idx})")
+            if "max_length" in field_def:
+                namespace[f"_maxlen{idx}"] = field_def["max_length"]
+                namespace[f"_long{idx}"] = (
+                    f"Field '{name}' too long (max: {field_def['max_length']})"
+                )
+                checks.append(f"if len(str(v)) > _maxlen{idx}:")
+                checks.append(f"    errors.append(_long{idx})")
+        
+        if "pattern" in field_def:
+            namespace[f"_p{idx}"] = patterns[name].match
+            namespace[f"_pm{idx}"] = f"Field '{name}' does not match required pattern"
+            checks.append(f"if not _p{idx}(str(v)):")
+            checks.append(f"    errors.append(_pm{idx})")
+        
+        if "enum" in field_def:
+            namespace[f"_e{idx}"] = field_def["enum"]
+            try:
+                namespace[f"_es{idx}"] = frozenset(field_def["enum"])
+            except TypeError:  # Unhashable allowed values, scan the list
+                namespace[f"_es{idx}"] = field_def["enum"]
+            checks.append(f"if v not in _es{idx}:")
+            checks.append(
+                f"    errors.append(f\"Field '{{_n{idx}}}' value '{{v}}' "
+                f"not in allowed values: {{_e{idx}}}\")"
+            )
+        
+        if checks:
+            lines.append("        else:")
+            lines.extend(f"            {line}" for line in checks)
+    
+    if len(lines) == 1:
+        lines.append("    pass")
+    
+    if fail_fast:
+        lines = [
+            out
+            for line in lines
+            for out in (
+                (line, line[:len(line) - len(line.lstrip())] + "return")
+                if line.lstrip().startswith("errors.append(") else (line,)
+            )
+        ]
+    
+    exec(compile("\n".join(lines), "<schema>", "exec"), namespace)
+    return namespace["validate_fields"]
+
+
+def _is_missing(value: Any) -> bool:
+    """Check whether a DataFrame cell stands for an absent value"""
+    return value is None or value is pd.NA or (isinstance(value, float) and value != value)
+
+
+def _column_kind(column: pd.Series) -> str:
+    """Classify a column for vectorized screening
+    
+    Args:
+        column: Column values
+        
+    Returns:
+        'bool', 'int', 'float', 'str' (all non-null values are str) or 'mixed'
+    """
+    if pd.api.types.is_bool_dtype(column):
+        return "bool"
+    if pd.api.types.is_integer_dtype(column):
+        return "int"
+    if pd.api.types.is_float_dtype(column):
+        return "float"
+    if pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty"):
+        return "str"
+    return "mixed"
+
 
 class ValidationError(Exception):
     """Raised when validation fails"""
@@ -24,6 +250,12 @@ class ValidationError(Exception):
 class SchemaValidator:
     """Validates data records against defined schemas"""
     
+    __slots__ = (
+        "schema", "config", "strict_mode", "allow_extra_fields", "_field_patterns",
+        "_schema_field_set", "_allowed_fields", "_required_fields",
+        "_validate_fields", "_validate_fields_fast"
+    )
+    
     SUPPORTED_TYPES = {
         "string": str,
         "integer": int,
@@ -36,6 +268,12 @@ class SchemaValidator:
         "url": str
     }
     
+    # Fields added by ingestion, always allowed alongside schema fields
+    METADATA_FIELDS = frozenset({
+        "_source", "_source_file", "_source_endpoint", "_source_db_type",
+        "_ingestion_timestamp", "_row_number", "_record_number"
+    })
+    
     def __init__(self, schema: Dict[str, Any], config: ConfigManager):
         """Initialize schema validator
         
@@ -47,8 +285,24 @@ class SchemaValidator:
         self.config = config
         self.strict_mode = config.get("validation.schema.strict_mode", True)
         self.allow_extra_fields = config.get("validation.schema.allow_extra_fields", False)
+        self._field_patterns: Dict[str, Any] = {}
         
         self._validate_schema_definition()
+        
+        # Field sets are fixed for the schema, so build them once
+        fields = self.schema["fields"]
+        self._schema_field_set = frozenset(fields)
+        self._allowed_fields = self._schema_field_set | self.METADATA_FIELDS
+        self._required_fields = frozenset(
+            name for name, field_def in fields.items()
+            if field_def.get("required", False)
+        )
+        
+        # Field checks specialized for this schema
+        self._validate_fields = _build_field_validator(fields, self._field_patterns)
+        self._validate_fields_fast = _build_field_validator(
+            fields, self._field_patterns, fail_fast=True
+        )
     
     def _validate_schema_definition(self) -> None:
         """Validate that the schema definition itself is valid"""
@@ -63,12 +317,20 @@ class SchemaValidator:
                 raise ValidationError(
                     f"Field '{field_name}' has unsupported type: {field_def['type']}"
                 )
+            
+            if "pattern" in field_def:
+                try:
+                    self._field_patterns[field_name] = _compile_pattern(field_def["pattern"])
+                except re.error as e:
+                    raise ValidationError(f"Field '{field_name}' has invalid pattern: {e}")
     
-    def validate(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def validate(self, record: Dict[str, Any], fail_fast: bool = False) -> Dict[str, Any]:
         """Validate a single record against the schema
         
         Args:
             record: Data record to validate
+            fail_fast: Stop at the first error, for callers that only need
+                the valid flag
             
         Returns:
             Validation result dictionary with 'valid' flag and 'errors' list
@@ -76,23 +338,22 @@ class SchemaValidator:
         errors = []
         
         # Check for required fields
-        required_fields = self._get_required_fields()
-        missing_fields = required_fields - set(record.keys())
+        missing_fields = self._required_fields - record.keys()
         
         if missing_fields:
             errors.append(f"Missing required fields: {', '.join(missing_fields)}")
         
         # Check for extra fields (if strict mode)
-        if not self.allow_extra_fields:
-            extra_fields = set(record.keys()) - set(self.schema["fields"].keys()) - self._get_metadata_fields()
+        if not self.allow_extra_fields and not (fail_fast and errors):
+            extra_fields = record.keys() - self._allowed_fields
             if extra_fields:
                 errors.append(f"Unexpected fields: {', '.join(extra_fields)}")
         
         # Validate each field
-        for field_name, field_def in self.schema["fields"].items():
-            if field_name in record:
-                field_errors = self._validate_field(field_name, record[field_name], field_def)
-                errors.extend(field_errors)
+        if not fail_fast:
+            self._validate_fields(record, errors)
+        elif not errors:
+            self._validate_fields_fast(record, errors)
         
         return {
             "valid": len(errors) == 0,
@@ -100,27 +361,203 @@ class SchemaValidator:
             "record": record
         }
     
-    def _get_required_fields(self) -> Set[str]:
-        """Get set of required field names
+    def validate_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, List[List[str]]]:
+        """Validate a batch of records held in a DataFrame
+        
+        Each field's type and constraints are checked column-wise with
+        pandas. Rows that are not certainly valid (a failed check, or
+        mixed-type columns that cannot be screened exactly) are then
+        re-checked with validate() to get their exact error messages.
+        Missing cells (None/NaN) are treated as absent fields, and whole
+        floats in integer fields (pandas upcasts integer columns that have
+        missing values) are treated as integers.
         
+        Args:
+            df: DataFrame with one row per record
+            
         Returns:
-            Set of required field names
+            Tuple of (boolean array of valid rows, error messages per row)
         """
-        return {
+        num_rows = len(df)
+        suspect = np.zeros(num_rows, dtype=bool)
+        columns = set(df.columns)
+        
+        if self._required_fields - columns:
+            suspect[:] = True
+        
+        if not self.allow_extra_fields:
+            for column in columns - self._allowed_fields:
+                suspect |= df[column].notna().to_numpy()
+        
+        for field_name, field_def in self.schema["fields"].items():
+            if field_name in columns:
+                suspect |= ~self._batch_field_ok(df[field_name], field_name, field_def)
+        
+        valid = ~suspect
+        errors: List[List[str]] = [[] for _ in range(num_rows)]
+        
+        integer_fields = {
             name for name, field_def in self.schema["fields"].items()
-            if field_def.get("required", False)
+            if field_def["type"] == "integer"
         }
+        
+        rows = np.flatnonzero(suspect)
+        for idx, row in zip(rows.tolist(), df.iloc[rows].to_dict(orient="records")):
+            record = {}
+            for key, value in row.items():
+                if _is_missing(value):
+                    continue
+                if key in integer_fields and isinstance(value, float) and value.is_integer():
+                    value = int(value)
+                record[key] = value
+            
+            row_errors = self.validate(record)["errors"]
+            errors[idx] = row_errors
+            valid[idx] = not row_errors
+        
+        return valid, errors
+    
+    def _batch_field_ok(
+        self,
+        column: pd.Series,
+        field_name: str,
+        field_def: Dict[str, Any]
+    ) -> np.ndarray:
+        """Screen one column, marking rows whose value is certainly valid
+        
+        Args:
+            column: Column values for the field
+            field_name: Name of the field
+            field_def: Field definition from schema
+            
+        Returns:
+            Boolean array, False where the row needs a row-wise check
+        """
+        present = column.notna().to_numpy()
+        required = field_def.get("required", False)
+        kind = _column_kind(column)
+        
+        if kind == "mixed":
+            # Only absent optional values can be cleared without a row check
+            return ~present if not required else np.zeros(len(column), dtype=bool)
+        
+        if kind == "str":
+            empty = present & (column == "").to_numpy()
+        else:
+            empty = np.zeros(len(column), dtype=bool)
+        
+        checked = present & ~empty
+        ok = self._batch_type_ok(column, field_def["type"], kind).copy()
+        
+        if kind == "str":
+            text = column.where(checked, "")
+        
+        # Numeric range (strings would fail the comparison in validate())
+        if field_def["type"] in ("integer", "float") and (
+            "min" in field_def or "max" in field_def
+        ):
+            if kind == "str":
+                ok = np.zeros(len(column), dtype=bool)
+            else:
+                if "min" in field_def:
+                    ok &= (column >= field_def["min"]).to_numpy()
+                if "max" in field_def:
+                    ok &= (column <= field_def["max"]).to_numpy()
+        
+        # String length
+        if field_def["type"] == "string" and kind == "str":
+            lengths = text.str.len().to_numpy()
+            if "min_length" in field_def:
+                ok &= lengths >= field_def["min_length"]
+            if "max_length" in field_def:
+                ok &= lengths <= field_def["max_length"]
+        
+        # Pattern
+        if "pattern" in field_def:
+            if kind == "str":
+                pattern = self._field_patterns[field_name]
+                if isinstance(pattern, re.Pattern):
+                    ok &= text.str.match(pattern.pattern, na=False).to_numpy()
+                else:
+                    # RE2 semantics differ from re (e.g. ASCII-only \d); use validate()'s engine
+                    ok &= np.fromiter(
+                        (pattern.match(value) is not None for value in text),
+                        dtype=bool,
+                        count=len(text)
+                    )
+            else:
+                ok = np.zeros(len(column), dtype=bool)
+        
+        # Enum
+        if "enum" in field_def:
+            ok &= column.isin(field_def["enum"]).to_numpy()
+        
+        result = ~checked | ok
+        if required:
+            result &= present & ~empty
+        
+        return result
+    
+    def _batch_type_ok(self, column: pd.Series, expected_type: str, kind: str) -> np.ndarray:
+        """Vectorized counterpart of _validate_type() for a screened column
+        
+        Args:
+            column: Column values
+            expected_type: Expected type name
+            kind: Column kind from _column_kind()
+            
+        Returns:
+            Boolean array, True where the value certainly has the type
+        """
+        num_rows = len(column)
+        
+        if kind == "float" and expected_type == "integer":
+            return (column % 1 == 0).to_numpy()
+        
+        if kind != "str":
+            # Numeric columns: isinstance() semantics (bool is an int)
+            accepted = {
+                "int": ("integer",),
+                "bool": ("integer", "boolean"),
+                "float": ("float",)
+            }[kind]
+            return np.full(num_rows, expected_type in accepted)
+        
+        text = column.fillna("")
+        
+        if expected_type == "string":
+            return np.ones(num_rows, dtype=bool)
+        if expected_type == "integer":
+            return text.str.fullmatch(_INT_STRING_RE, na=False).to_numpy()
+        if expected_type == "float":
+            return text.str.fullmatch(_FLOAT_STRING_RE, na=False).to_numpy()
+        if expected_type == "boolean":
+            return text.str.lower().isin(["true", "false", "1", "0"]).to_numpy()
+        
+        builtin = {
+            "email": _EMAIL_RE,
+            "phone": _PHONE_RE,
+            "url": _URL_RE,
+            "date": _DATE_RE,
+            "datetime": _DATE_RE
+        }[expected_type]
+        return text.str.match(builtin.pattern, na=False).to_numpy()
     
-    def _get_metadata_fields(self) -> Set[str]:
+    def _get_required_fields(self) -> FrozenSet[str]:
+        """Get set of required field names
+        
+        Returns:
+            Set of required field names
+        """
+        return self._required_fields
+    
+    def _get_metadata_fields(self) -> FrozenSet[str]:
         """Get set of metadata field names (added by ingestion)
         
         Returns:
             Set of metadata field names
         """
-        return {
-            "_source", "_source_file", "_source_endpoint", "_source_db_type",
-            "_ingestion_timestamp", "_row_number", "_record_number"
-        }
+        return self.METADATA_FIELDS
     
     def _validate_field(
         self,
@@ -173,7 +610,10 @@ class SchemaValidator:
         
         # Pattern validation
         if "pattern" in field_def:
-            if not re.match(field_def["pattern"], str(value)):
+            pattern = self._field_patterns.get(field_name)
+            if pattern is None:
+                pattern = self._field_patterns[field_name] = _compile_pattern(field_def["pattern"])
+            if not pattern.match(str(value)):
                 errors.append(f"Field '{field_name}' does not match required pattern")
         
         # Enum validation
@@ -207,14 +647,14 @@ class SchemaValidator:
                 elif expected_type == "boolean":
                     return value.lower() in ["true", "false", "1", "0"]
                 elif expected_type == "email":
-                    return bool(re.match(r"^[^@]+@[^@]+\.[^@]+$", value))
+                    return "@" in value and bool(_EMAIL_RE.match(value))
                 elif expected_type == "phone":
-                    return bool(re.match(r"^\+?[\d\s\-\(\)]{10,}$", value))
+                    return bool(_PHONE_RE.match(value))
                 elif expected_type == "url":
-                    return bool(re.match(r"^https?://", value))
+                    return bool(_URL_RE.match(value))
                 elif expected_type in ["date", "datetime"]:
                     # Basic ISO format check
-                    return bool(re.match(r"^\d{4}-\d{2}-\d{2}", value))
+                    return bool(_DATE_RE.match(value))
                 else:  # string
                     return True
             except (ValueError, TypeError):
@@ -239,21 +679,33 @@ class SchemaValidator:
         if not path.exists():
             raise ValidationError(f"Schema file not found: {schema_path}")
         
-        with open(path, 'r') as f:
-            schema = yaml.safe_load(f)
+        key = (str(path.resolve()), path.stat().st_mtime_ns)
+        schema = _SCHEMA_CACHE.get(key)
+        
+        if schema is None:
+            with open(path, 'r') as f:
+                schema = yaml.load(f, Loader=_YamlLoader)
+            _SCHEMA_CACHE[key] = schema
         
-        return cls(schema, config)
+        return cls(copy.deepcopy(schema), config)
 
 
 class DataQualityChecker:
     """Performs data quality checks on ingested data"""
     
+    __slots__ = ("config",)
+    
     def __init__(self, config: ConfigManager):
         self.config = config
     
     def check_quality(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Perform quality checks on a batch of records
         
+        Only values present in a record count towards the null percentage,
+        and only None and "" are null. Records are duplicates when their
+        own non-metadata items are equal, so records with different keys
+        never match.
+        
         Args:
             records: List of data records
             
@@ -261,6 +713,88 @@ class DataQualityChecker:
             Quality report dictionary
         """
         if not records:
+            return self._build_report(0, 0, 0, 0)
+        
+        null_count = value_count = duplicate_count = 0
+        
+        for keys, group in self._group_by_keys(records):
+            columns = {key: [record[key] for record in group] for key in keys}
+            
+            null_count += sum(
+                column.count(None) + column.count("") for column in columns.values()
+            )
+            value_count += len(keys) * len(group)
+            duplicate_count += self._count_duplicates(
+                pd.DataFrame(columns, index=pd.RangeIndex(len(group)), dtype=object)
+            )
+        
+        return self._build_report(len(records), null_count, value_count, duplicate_count)
+    
+    @staticmethod
+    def _group_by_keys(
+        records: List[Dict[str, Any]]
+    ) -> List[Tuple[List[Any], List[Dict[str, Any]]]]:
+        """Group records that have the same non-metadata keys
+        
+        Args:
+            records: Non-empty list of data records
+            
+        Returns:
+            List of (non-metadata keys, records with exactly those keys)
+        """
+        first = records[0].keys()
+        
+        # Records of one source usually share their keys
+        if all(record.keys() == first for record in records):
+            return [([key for key in first if not str(key).startswith("_")], records)]
+        
+        groups: Dict[FrozenSet[Any], List[Dict[str, Any]]] = {}
+        for record in records:
+            keys = frozenset(key for key in record if not str(key).startswith("_"))
+            groups.setdefault(keys, []).append(record)
+        
+        return [(list(keys), group) for keys, group in groups.items()]
+    
+    def check_quality_df(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Perform quality checks on a batch of records held in a DataFrame
+        
+        Every cell is a value here, and NaN counts as null along with None
+        and "", since a DataFrame fills missing values with NaN.
+        
+        Args:
+            df: DataFrame with one row per record
+            
+        Returns:
+            Quality report dictionary
+        """
+        if df.empty:
+            return self._build_report(0, 0, 0, 0)
+        
+        # Skip metadata fields added by ingestion
+        data = df[[c for c in df.columns if not str(c).startswith("_")]]
+        null_count, duplicate_count = self._count_nulls_and_duplicates(data)
+        
+        return self._build_report(len(df), null_count, data.size, duplicate_count)
+    
+    def _build_report(
+        self,
+        total_records: int,
+        null_count: int,
+        value_count: int,
+        duplicate_count: int
+    ) -> Dict[str, Any]:
+        """Score the counted checks and build the quality report
+        
+        Args:
+            total_records: Number of records checked
+            null_count: Null values among the checked values
+            value_count: Number of non-metadata values checked
+            duplicate_count: Records equal to an earlier record
+            
+        Returns:
+            Quality report dictionary
+        """
+        if not total_records:
             return {
                 "total_records": 0,
                 "quality_score": 0,
@@ -271,10 +805,12 @@ class DataQualityChecker:
         
         # Null check
         if self.config.get("validation.quality_checks.null_check", True):
-            checks["null_percentage"] = self._check_null_values(records)
+            checks["null_percentage"] = (
+                round(null_count / value_count * 100, 2) if value_count else 0.0
+            )
         
         # Duplicate check
-        checks["duplicate_count"] = self._check_duplicates(records)
+        checks["duplicate_count"] = duplicate_count
         
         # Calculate overall quality score
         null_threshold = self.config.get("validation.thresholds.max_null_percentage", 5)
@@ -283,59 +819,46 @@ class DataQualityChecker:
         quality_score = max(0, 100 - (null_penalty * 50))
         
         return {
-            "total_records": len(records),
+            "total_records": total_records,
             "quality_score": round(quality_score, 2),
             "checks": checks
         }
     
-    def _check_null_values(self, records: List[Dict[str, Any]]) -> float:
-        """Check percentage of null values across all fields
+    def _count_nulls_and_duplicates(self, data: pd.DataFrame) -> Tuple[int, int]:
+        """Count null cells and duplicate rows in one factorized pass
+        
+        Missing fields count as null, since the DataFrame fills them in.
         
         Args:
-            records: List of records
+            data: DataFrame of non-metadata columns
             
         Returns:
-            Percentage of null values
+            Tuple of (null cell count, duplicate row count)
         """
-        if not records:
-            return 0.0
-        
-        total_values = 0
-        null_count = 0
-        
-        for record in records:
-            for key, value in record.items():
-                if not key.startswith("_"):  # Skip metadata fields
-                    total_values += 1
-                    if value is None or value == "":
-                        null_count += 1
-        
-        return round((null_count / total_values * 100), 2) if total_values > 0 else 0.0
+        try:
+            codes, null_counts = factorize_columns(data)
+        except TypeError:
+            # Unhashable values (nested dicts/lists): hash canonical encodings
+            null_mask = data.isna().to_numpy() | (data == "").to_numpy()
+            duplicates = count_duplicate_rows(data.to_dict(orient="records"))
+            return int(np.count_nonzero(null_mask)), duplicates
+        
+        return count_nulls_and_duplicates(codes, null_counts)
     
-    def _check_duplicates(self, records: List[Dict[str, Any]]) -> int:
-        """Check for duplicate records
+    @staticmethod
+    def _count_duplicates(data: pd.DataFrame) -> int:
+        """Count duplicate rows of an object DataFrame without filled-in values
         
         Args:
-            records: List of records
+            data: DataFrame of non-metadata columns
             
         Returns:
-            Count of duplicate records
+            Duplicate row count
         """
-        seen = set()
-        duplicates = 0
-        
-        for record in records:
-            # Create hashable representation (exclude metadata)
-            record_tuple = tuple(
-                sorted(
-                    (k, v) for k, v in record.items()
-                    if not k.startswith("_")
-                )
-            )
-            
-            if record_tuple in seen:
-                duplicates += 1
-            else:
-                seen.add(record_tuple)
+        try:
+            codes, _ = factorize_columns(data)
+        except TypeError:
+            # Unhashable values (nested dicts/lists): hash canonical encodings
+            return count_duplicate_rows(data.to_dict(orient="records"))
         
-        return duplicates
+        return count_duplicate_codes(codes)
@@ -0,0 +1,133 @@
+"""Validation Kernels Module
+
+Array kernels backing DataQualityChecker. Columns are factorized into
+integer ids once, so null counting and duplicate detection run as
+vectorized NumPy passes instead of per-record Python loops.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib JSON encoder
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # Fall back to the builtin hash of the encoded bytes
+    xxhash = None
+
+
+def factorize_columns(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode every column as integer ids and count its nulls
+    
+    Equal values within a column share an id; nulls get id -1. Nulls are
+    counted column by column instead of keeping a rows x columns mask,
+    so only one column's worth of booleans is ever live.
+    
+    Args:
+        data: DataFrame of the columns to check
+    
+    Returns:
+        Tuple of (int64 ids of shape rows x columns, int64 null count per column)
+    
+    Raises:
+        TypeError: If a column holds unhashable values
+    """
+    num_rows, num_cols = data.shape
+    codes = np.empty((num_rows, num_cols), dtype=np.int64)
+    null_counts = np.empty(num_cols, dtype=np.int64)
+    
+    for idx in range(num_cols):
+        column = data.iloc[:, idx]
+        codes[:, idx] = pd.factorize(column)[0]
+        null_counts[idx] = np.count_nonzero(
+            (codes[:, idx] == -1) | (column == "").to_numpy()
+        )
+    
+    return codes, null_counts
+
+
+def count_nulls_and_duplicates(
+    codes: np.ndarray,
+    null_counts: np.ndarray
+) -> Tuple[int, int]:
+    """Count null cells and duplicate rows in factorized data
+    
+    Args:
+        codes: Integer ids from factorize_columns()
+        null_counts: Per-column null counts from factorize_columns()
+    
+    Returns:
+        Tuple of (null cell count, duplicate row count)
+    """
+    return int(null_counts.sum()), count_duplicate_codes(codes)
+
+
+def count_duplicate_codes(codes: np.ndarray) -> int:
+    """Count duplicate rows in factorized data
+    
+    Args:
+        codes: Integer ids from factorize_columns()
+    
+    Returns:
+        Count of rows equal to an earlier row
+    """
+    num_rows, num_cols = codes.shape
+    
+    if num_rows == 0:
+        return 0
+    
+    if num_cols == 0:
+        # Every row is empty, so all but the first repeat it
+        return num_rows - 1
+    
+    return num_rows - np.unique(codes, axis=0).shape[0]
+
+
+def _canonical_bytes(row: Dict[str, Any]) -> bytes:
+    """Encode a row as JSON with sorted keys at every nesting level
+    
+    Args:
+        row: Row dictionary, possibly holding nested dicts and lists
+    
+    Returns:
+        Canonical UTF-8 JSON encoding
+    """
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_SORT_KEYS, default=str)
+    
+    return json.dumps(row, sort_keys=True, default=str).encode()
+
+
+def count_duplicate_rows(rows: Iterable[Dict[str, Any]]) -> int:
+    """Count duplicate rows by hashing their canonical JSON encoding
+    
+    Works for unhashable values (nested dicts and lists), which the
+    factorized path cannot handle. Rows are compared by a 64-bit xxh3
+    hash when xxhash is installed.
+    
+    Args:
+        rows: Row dictionaries to compare
+    
+    Returns:
+        Count of rows equal to an earlier row
+    """
+    seen = set()
+    duplicates = 0
+    
+    for row in rows:
+        encoded = _canonical_bytes(row)
+        digest = xxhash.xxh3_64_intdigest(encoded) if xxhash is not None else hash(encoded)
+        
+        if digest in seen:
+            duplicates += 1
+        else:
+            seen.add(digest)
+    
+    return duplicates
+
@@ -2,8 +2,10 @@
 
 import os
 import pytest
+import yaml
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from src.config_manager import ConfigManager, ConfigurationError
 
@@ -78,3 +80,91 @@ class TestConfigManager:
         # This should work fine
         config = ConfigManager(config_dir="config", environment="dev")
         assert config.get("ingestion") is not None
+    
+    def test_get_section_and_leaf(self):
+        """Test dotted lookups for both sub-sections and leaf values"""
+        config = ConfigManager(config_dir="config", environment="dev")
+        
+        database = config.get("database")
+        assert isinstance(database, dict)
+        assert config.get("database.host") == database["host"]
+        assert config.get("database.host.extra", "missing") == "missing"
+    
+    def test_returned_sections_do_not_change_config(self):
+        """Test that editing get_all() or a section leaves later lookups consistent"""
+        config = ConfigManager(config_dir="config", environment="dev")
+        sources = config.get("ingestion.sources")
+        
+        config.get_all()["ingestion"]["sources"] = {}
+        config.get("ingestion")["sources"] = {}
+        
+        assert config.get("ingestion")["sources"] == sources
+        assert config.get("ingestion.sources") == sources
+    
+    def test_section_lookup_cached_until_reload(self, tmp_path):
+        """Test that section lookups are memoized and refreshed on reload"""
+        default_path = tmp_path / "default.yaml"
+        default_path.write_text(
+            "ingestion: {batch_size: 10}\nvalidation: {}\nlogging: {level: INFO}\n"
+        )
+        config = ConfigManager(config_dir=str(tmp_path), environment="test")
+        
+        assert config.get("ingestion") == {"batch_size": 10}
+        assert config.get("ingestion") == config.get("ingestion")
+        assert config._resolve_cached.cache_info().hits == 2
+        
+        default_path.write_text(
+            "ingestion: {batch_size: 20}\nvalidation: {}\nlogging: {level: INFO}\n"
+        )
+        stat = default_path.stat()
+        os.utime(default_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        config.reload()
+        
+        assert config.get("ingestion") == {"batch_size": 20}
+    
+    def test_dotenv_parsed_once(self):
+        """Test that .env is parsed once and re-read only on reload"""
+        ConfigManager.clear_env_cache()
+        
+        with patch("src.config_manager.load_dotenv") as mock_load_dotenv:
+            config = ConfigManager(config_dir="config", environment="dev")
+            ConfigManager(config_dir="config", environment="prod")
+            assert mock_load_dotenv.call_count == 1
+            
+            config.reload()
+            assert mock_load_dotenv.call_count == 2
+        
+        ConfigManager.clear_env_cache()
+    
+    def test_yaml_parsed_once_until_modified(self, tmp_path):
+        """Test that unchanged YAML files are not re-parsed"""
+        (tmp_path / "default.yaml").write_text(
+            "ingestion: {batch_size: 10}\nvalidation: {}\nlogging: {level: INFO}\n"
+        )
+        
+        with patch("src.config_manager.yaml.load", wraps=yaml.load) as mock_load:
+            config = ConfigManager(config_dir=str(tmp_path), environment="test")
+            config.reload()
+            assert mock_load.call_count == 1
+            
+            default_path = tmp_path / "default.yaml"
+            default_path.write_text(
+                "ingestion: {batch_size: 20}\nvalidation: {}\nlogging: {level: INFO}\n"
+            )
+            stat = default_path.stat()
+            os.utime(default_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            config.reload()
+            
+            assert mock_load.call_count == 2
+            assert config.get("ingestion.batch_size") == 20
+    
+    def test_merge_configs_nested(self):
+        """Test deep merge of nested overrides without mutating inputs"""
+        config = ConfigManager(config_dir="config", environment="dev")
+        base = {"a": {"b": {"c": 1, "d": 2}, "e": [1, 2]}, "f": 1}
+        override = {"a": {"b": {"c": 10}, "e": [3]}, "g": 2}
+        
+        merged = config._merge_configs(base, override)
+        
+        assert merged == {"a": {"b": {"c": 10, "d": 2}, "e": [3]}, "f": 1, "g": 2}
+        assert base["a"]["b"]["c"] == 1
@@ -1,7 +1,15 @@
 """Unit tests for Data Ingestion Module"""
 
+import io
+import json
+import shutil
 import pytest
 import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+import psycopg2.extensions
+import pymysql.cursors
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -10,7 +18,8 @@ from src.ingestion import (
     APIDataSource,
     DatabaseDataSource,
     DataIngestionPipeline,
-    IngestionError
+    IngestionError,
+    RecordBatch
 )
 from src.config_manager import ConfigManager
 
@@ -21,6 +30,25 @@ def config():
     return ConfigManager(config_dir="config", environment="dev")
 
 
+def make_json_response(payload):
+    """Build a mock HTTP response carrying a JSON body"""
+    return Mock(
+        content=json.dumps(payload).encode(),
+        json=Mock(return_value=payload),
+        raise_for_status=Mock()
+    )
+
+
+@pytest.fixture
+def streaming_config(tmp_path):
+    """Fixture providing configuration with API record streaming enabled"""
+    shutil.copy(Path("config") / "default.yaml", tmp_path / "default.yaml")
+    (tmp_path / "stream.yaml").write_text(
+        "ingestion:\n  sources:\n    api:\n      records_path: data.item\n"
+    )
+    return ConfigManager(config_dir=str(tmp_path), environment="stream")
+
+
 @pytest.fixture
 def sample_csv_file():
     """Fixture creating a temporary CSV file"""
@@ -37,6 +65,23 @@ def sample_csv_file():
     Path(temp_path).unlink(missing_ok=True)
 
 
+@contextmanager
+def ragged_csv_backend(backend):
+    """Parse CSV with the csv module alone, or try PyArrow first and check it ran"""
+    if backend == "csv":
+        with patch('src.ingestion.pa_csv', None):
+            yield
+        return
+    
+    pytest.importorskip("pyarrow.csv")
+    with patch.object(
+        CSVDataSource, '_read_arrow_batches', autospec=True,
+        side_effect=CSVDataSource._read_arrow_batches
+    ) as arrow:
+        yield
+    arrow.assert_called_once()
+
+
 class TestCSVDataSource:
     """Test suite for CSV data source"""
     
@@ -55,6 +100,217 @@ class TestCSVDataSource:
         assert records[0]['_source'] == 'csv'
         assert '_ingestion_timestamp' in records[0]
     
+    def test_csv_ingestion_across_chunks(self, config, tmp_path):
+        """Test row numbering and raw string values across parse chunks"""
+        csv_path = tmp_path / "large.csv"
+        rows = ["id,name,zip"] + [f"{i},Name {i},{i:05d}" for i in range(1, 251)]
+        csv_path.write_text("\n".join(rows) + "\n")
+        
+        source = CSVDataSource(config, str(csv_path))
+        records = list(source.ingest())
+        
+        assert len(records) == 250
+        assert [r['_row_number'] for r in records] == list(range(2, 252))
+        assert records[0]['zip'] == '00001'
+        assert source.get_stats()['success'] == 250
+    
+    @pytest.mark.parametrize("backend", ["csv", "arrow"])
+    @pytest.mark.parametrize("text", ["a,b\n1,2,3\n4,5\n", "a,b\n4,5\n1\n"])
+    def test_csv_ragged_row_rejected(self, config, tmp_path, text, backend):
+        """Test that strict mode fails on a row with a different field count"""
+        csv_path = tmp_path / "ragged.csv"
+        csv_path.write_text(text)
+        source = CSVDataSource(config, str(csv_path))
+        source.reject_ragged_rows = True
+        
+        with ragged_csv_backend(backend), pytest.raises(IngestionError, match="fields, expected 2"):
+            list(source.ingest())
+    
+    @pytest.mark.parametrize("backend", ["csv", "arrow"])
+    def test_csv_ragged_row_fails_at_same_batch(self, config, tmp_path, backend):
+        """Test that both backends yield the same batches before a ragged row fails"""
+        csv_path = tmp_path / "ragged.csv"
+        csv_path.write_text("a,b\n1,2\n3,4\n5,6,7\n8,9\n")
+        source = CSVDataSource(config, str(csv_path))
+        source.reject_ragged_rows = True
+        source.batch_size = 2
+        
+        yielded = []
+        with ragged_csv_backend(backend), pytest.raises(IngestionError, match="CSV row 4 has 3 fields, expected 2"):
+            for batch in source.ingest_batches():
+                yielded.append(batch.columns)
+        
+        assert yielded == [{"a": ["1", "3"], "b": ["2", "4"]}]
+    
+    @pytest.mark.parametrize("backend", ["csv", "arrow"])
+    def test_csv_ragged_rows_match_dictreader(self, config, tmp_path, backend):
+        """Test that short rows are padded and extra values kept, like csv.DictReader"""
+        import csv
+        
+        text = "a,b,c\n1,2,3\n4\n5,6,7,8,9\n\n10,11,12\n"
+        csv_path = tmp_path / "ragged.csv"
+        csv_path.write_text(text)
+        source = CSVDataSource(config, str(csv_path))
+        
+        with ragged_csv_backend(backend):
+            records = list(source.ingest())
+        
+        for record in records:
+            for key in ('_source', '_source_file', '_ingestion_timestamp', '_row_number'):
+                del record[key]
+        assert records == list(csv.DictReader(io.StringIO(text)))
+        assert records[1] == {'a': '4', 'b': None, 'c': None}
+        assert records[2][None] == ['8', '9']
+    
+    def test_csv_ragged_row_not_cached(self, config, tmp_path):
+        """Test that a ragged file is never cached, in either ragged-row mode"""
+        pytest.importorskip("pyarrow.parquet")
+        csv_path = tmp_path / "ragged.csv"
+        csv_path.write_text("a,b\n1,2,3\n4,5\n")
+        source = CSVDataSource(config, str(csv_path))
+        source.cache_path = source._get_cache_path(str(tmp_path / "cache"))
+        
+        assert [r['b'] for r in source.ingest()] == ['2', '5']
+        assert not source.cache_path.exists()
+        
+        source.reject_ragged_rows = True
+        with pytest.raises(IngestionError, match="fields, expected 2"):
+            list(source.ingest())
+        
+        assert not source.cache_path.exists()
+        assert list(source.cache_path.parent.glob("*.tmp")) == []
+    
+    def test_csv_duplicate_header_keeps_last_value(self, config, tmp_path):
+        """Test that duplicate column names keep the last value, like csv.DictReader"""
+        csv_path = tmp_path / "dupes.csv"
+        csv_path.write_text("a,a,b\n1,2,3\n\n4,5,6\n")
+        
+        with patch('src.ingestion.pa_csv', None):
+            records = list(CSVDataSource(config, str(csv_path)).ingest())
+        
+        assert [(r['a'], r['b']) for r in records] == [('2', '3'), ('5', '6')]
+    
+    def test_csv_arrow_matches_pandas(self, config, tmp_path):
+        """Test that the PyArrow reader yields the same values as the csv module"""
+        pytest.importorskip("pyarrow")
+        csv_path = tmp_path / "mixed.csv"
+        csv_path.write_text('id,name,zip\n1,"Doe, John",00001\n2,,00002\n')
+        
+        source = CSVDataSource(config, str(csv_path))
+        arrow_rows = list(source._iter_column_batches())
+        
+        with patch('src.ingestion.pa_csv', None):
+            pandas_rows = list(source._iter_column_batches())
+        
+        assert arrow_rows == pandas_rows
+    
+    def test_csv_parquet_cache(self, config, sample_csv_file, tmp_path):
+        """Test that a second read of an unchanged file comes from Parquet"""
+        pytest.importorskip("pyarrow.parquet")
+        source = CSVDataSource(config, sample_csv_file)
+        source.cache_path = source._get_cache_path(str(tmp_path / "cache"))
+        
+        first = list(source._iter_column_batches())
+        assert source.cache_path.exists()
+        assert list(source.cache_path.parent.glob("*.tmp")) == []
+        
+        with patch.object(CSVDataSource, '_read_arrow_batches', side_effect=AssertionError):
+            second = list(source._iter_column_batches())
+        
+        assert second == first
+    
+    def test_csv_cache_evicts_stale_versions(self, config, tmp_path):
+        """Test that rebuilding the cache after an edit removes the old entry"""
+        pytest.importorskip("pyarrow.parquet")
+        cache_dir = tmp_path / "cache"
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("id,name\n1,Alice\n")
+        
+        other_path = tmp_path / "other.csv"
+        other_path.write_text("id,name\n9,Zed\n")
+        other = CSVDataSource(config, str(other_path))
+        other.cache_path = other._get_cache_path(str(cache_dir))
+        list(other._iter_column_batches())
+        
+        source = CSVDataSource(config, str(csv_path))
+        source.cache_path = source._get_cache_path(str(cache_dir))
+        list(source._iter_column_batches())
+        old_cache = source.cache_path
+        
+        csv_path.write_text("id,name\n1,Alice\n2,Bob\n")
+        source = CSVDataSource(config, str(csv_path))
+        source.cache_path = source._get_cache_path(str(cache_dir))
+        rows = list(source._iter_column_batches())
+        
+        assert rows == [(["id", "name"], [["1", "2"], ["Alice", "Bob"]])]
+        assert source.cache_path != old_cache
+        assert sorted(cache_dir.glob("*.parquet")) == sorted([source.cache_path, other.cache_path])
+    
+    def test_csv_cache_disabled_by_default(self, config, sample_csv_file):
+        """Test that no cache is used unless a cache directory is configured"""
+        assert CSVDataSource(config, sample_csv_file).cache_path is None
+    
+    def test_csv_ingest_batches(self, config, sample_csv_file):
+        """Test that CSV batches keep columns and store metadata once"""
+        source = CSVDataSource(config, sample_csv_file)
+        batch = next(source.ingest_batches())
+        
+        assert isinstance(batch, RecordBatch)
+        assert len(batch) == 3
+        assert batch.columns['name'] == ['John Doe', 'Jane Smith', 'Bob Johnson']
+        assert batch.metadata['_source'] == 'csv'
+        
+        records = list(CSVDataSource(config, sample_csv_file).ingest())
+        assert [
+            {k: v for k, v in r.items() if k != '_ingestion_timestamp'}
+            for r in batch.to_records()
+        ] == [
+            {k: v for k, v in r.items() if k != '_ingestion_timestamp'}
+            for r in records
+        ]
+        
+        frame = batch.to_frame()
+        assert frame['_row_number'].tolist() == [2, 3, 4]
+        assert (frame['_source'] == 'csv').all()
+    
+    def test_record_batch_to_arrow(self, config, sample_csv_file):
+        """Test that batches convert to Arrow with metadata as columns"""
+        pytest.importorskip("pyarrow")
+        batch = next(CSVDataSource(config, sample_csv_file).ingest_batches())
+        
+        arrow_batch = batch.to_arrow()
+        
+        assert arrow_batch.num_rows == 3
+        assert arrow_batch.to_pylist() == batch.to_records()
+    
+    def test_record_batch_to_arrow_requires_pyarrow(self, config, sample_csv_file):
+        """Test that Arrow conversion fails clearly without pyarrow"""
+        batch = next(CSVDataSource(config, sample_csv_file).ingest_batches())
+        
+        with patch('src.ingestion.pa', None):
+            with pytest.raises(IngestionError, match="pyarrow is required"):
+                batch.to_arrow()
+    
+    def test_csv_record_layout(self, config, sample_csv_file):
+        """Test that columns come first, followed by metadata fields"""
+        source = CSVDataSource(config, sample_csv_file)
+        record = next(source.ingest())
+        
+        assert list(record) == [
+            'id', 'name', 'email',
+            '_source', '_source_file', '_ingestion_timestamp', '_row_number'
+        ]
+        assert type(record['_row_number']) is int
+    
+    def test_csv_empty_file(self, config, tmp_path):
+        """Test that an empty CSV file yields no records"""
+        csv_path = tmp_path / "empty.csv"
+        csv_path.write_text("")
+        
+        source = CSVDataSource(config, str(csv_path))
+        
+        assert list(source.ingest()) == []
+    
     def test_csv_file_not_found(self, config):
         """Test error handling for missing CSV file"""
         with pytest.raises(IngestionError, match="CSV file not found"):
@@ -73,17 +329,14 @@ class TestCSVDataSource:
 class TestAPIDataSource:
     """Test suite for API data source"""
     
-    @patch('src.ingestion.requests.get')
+    @patch('src.ingestion.requests.Session.get')
     def test_api_ingestion_success(self, mock_get, config):
         """Test successful API ingestion"""
         # Mock API response
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_get.return_value = make_json_response([
             {"id": 1, "name": "Item 1"},
             {"id": 2, "name": "Item 2"}
-        ]
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        ])
         
         source = APIDataSource(config, "https://api.example.com/data")
         records = list(source.ingest())
@@ -93,37 +346,78 @@ class TestAPIDataSource:
         assert '_source' in records[0]
         assert records[0]['_source'] == 'api'
     
-    @patch('src.ingestion.requests.get')
-    @patch('src.ingestion.time.sleep')
-    def test_api_retry_logic(self, mock_sleep, mock_get, config):
-        """Test API retry mechanism on failure"""
+    def test_api_retry_logic(self, config):
+        """Test API retry mechanism is configured on the session adapter"""
+        source = APIDataSource(config, "https://api.example.com/data")
+        
+        retry = source.session.get_adapter("https://api.example.com/data").max_retries
+        
+        # max_retries attempts in total: one request plus retries
+        assert retry.total == config.get("ingestion.sources.api.max_retries") - 1
+        assert retry.backoff_factor == config.get("ingestion.sources.api.retry_delay_seconds")
+        assert retry.backoff_jitter == config.get("ingestion.sources.api.retry_jitter_seconds")
+        assert retry.respect_retry_after_header
+        assert 503 in retry.status_forcelist
+        assert source.session.get_adapter("http://api.example.com").max_retries is retry
+    
+    def test_api_retries_transient_status(self, config, monkeypatch):
+        """Test a 503 is retried through the mounted adapter until a 200 arrives"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        statuses = [503, 503, 200]
+        requests_seen = []
+        
+        class FlakyHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_seen.append(self.path)
+                status = statuses[len(requests_seen) - 1]
+                body = json.dumps([{"id": 1}] if status == 200 else {"error": "busy"}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+        sleeps = []
+        monkeypatch.setattr("urllib3.util.retry.time.sleep", sleeps.append)
+        
+        try:
+            source = APIDataSource(config, f"http://127.0.0.1:{server.server_port}/data")
+            records = list(source.ingest())
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert len(requests_seen) == 3
+        assert sleeps  # Backed off instead of retrying immediately
+        assert [record["id"] for record in records] == [1]
+    
+    @patch('src.ingestion.requests.Session.get')
+    def test_api_retries_exhausted(self, mock_get, config):
+        """Test API ingestion fails once the adapter gives up retrying"""
         import requests
         
-        # First two calls fail, third succeeds
-        mock_get.side_effect = [
-            requests.exceptions.RequestException("Connection error"),
-            requests.exceptions.RequestException("Connection error"),
-            Mock(json=lambda: [{"id": 1}], raise_for_status=Mock())
-        ]
+        mock_get.side_effect = requests.exceptions.RetryError("Max retries exceeded")
         
         source = APIDataSource(config, "https://api.example.com/data")
         
-        # Should succeed after retries
-        records = list(source.ingest())
-        assert len(records) == 1
-        assert mock_get.call_count == 3
-        assert mock_sleep.call_count == 2  # Two retries means two sleeps
+        with pytest.raises(IngestionError, match="API request failed"):
+            list(source.ingest())
     
-    @patch('src.ingestion.requests.get')
+    @patch('src.ingestion.requests.Session.get')
     def test_api_auth_header(self, mock_get, config, monkeypatch):
         """Test API authentication header"""
         monkeypatch.setenv("API_KEY", "test_key_123")
         config.reload()
         
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_json_response([])
         
         source = APIDataSource(config, "https://api.example.com/data")
         list(source.ingest())
@@ -134,6 +428,112 @@ class TestAPIDataSource:
         assert 'Authorization' in headers
 
 
+    @patch('src.ingestion.requests.Session.get')
+    def test_api_concurrent_pages(self, mock_get, config):
+        """Test pages are fetched in parallel but yielded in page order"""
+        def respond(url, params, **kwargs):
+            # Later pages answer first to exercise reordering
+            time.sleep(0.01 * (4 - params["page"]))
+            return make_json_response([{"page": params["page"], "limit": params["limit"]}])
+        
+        mock_get.side_effect = respond
+        
+        source = APIDataSource(
+            config,
+            "https://api.example.com/data",
+            params={"limit": 10},
+            pages=[{"page": page} for page in range(1, 5)]
+        )
+        records = list(source.ingest())
+        
+        assert [r["page"] for r in records] == [1, 2, 3, 4]
+        assert [r["_record_number"] for r in records] == [1, 2, 3, 4]
+        assert all(r["limit"] == 10 for r in records)
+        assert mock_get.call_count == 4
+    
+    def test_api_sources_share_session(self, config):
+        """Test that sources with the same retry policy reuse one pool"""
+        first = APIDataSource(config, "https://api.example.com/a")
+        second = APIDataSource(config, "https://api.example.com/b")
+        
+        assert first.session is second.session
+    
+    @patch('src.ingestion.requests.Session.get')
+    def test_api_streaming_ingestion(self, mock_get, streaming_config):
+        """Test API records are parsed incrementally from the response stream"""
+        pytest.importorskip("ijson")
+        
+        mock_response = Mock()
+        mock_response.raw = io.BytesIO(b'{"data": [{"id": 1}, {"id": 2, "score": 2.5}]}')
+        mock_get.return_value = mock_response
+        
+        source = APIDataSource(streaming_config, "https://api.example.com/data")
+        records = list(source.ingest())
+        
+        assert mock_get.call_args.kwargs['stream'] is True
+        assert [r['id'] for r in records] == [1, 2]
+        assert isinstance(records[1]['score'], float)
+        assert records[1]['_record_number'] == 2
+        mock_response.close.assert_called_once()
+    
+    @patch('src.ingestion.ijson', None)
+    @patch('src.ingestion.requests.Session.get')
+    def test_api_streaming_fallback(self, mock_get, streaming_config):
+        """Test API ingestion loads the full body when ijson is unavailable"""
+        mock_get.return_value = make_json_response({"data": [{"id": 1}]})
+        
+        source = APIDataSource(streaming_config, "https://api.example.com/data")
+        records = list(source.ingest())
+        
+        assert mock_get.call_args.kwargs['stream'] is False
+        assert len(records) == 1
+    
+    @pytest.mark.parametrize("streaming", [True, False])
+    @patch('src.ingestion.requests.Session.get')
+    def test_api_records_path_with_and_without_ijson(self, mock_get, streaming, tmp_path):
+        """Test records_path selects the same records whether or not ijson is installed"""
+        if streaming:
+            pytest.importorskip("ijson")
+        shutil.copy(Path("config") / "default.yaml", tmp_path / "default.yaml")
+        (tmp_path / "nested.yaml").write_text(
+            "ingestion:\n  sources:\n    api:\n      records_path: payload.rows.item\n"
+        )
+        config = ConfigManager(config_dir=str(tmp_path), environment="nested")
+        payload = {"data": [{"id": 0}], "payload": {"rows": [{"id": 1}, {"id": 2}]}}
+        mock_response = make_json_response(payload)
+        mock_response.raw = io.BytesIO(json.dumps(payload).encode())
+        mock_get.return_value = mock_response
+        
+        source = APIDataSource(config, "https://api.example.com/data")
+        with patch('src.ingestion.ijson', None) if not streaming else nullcontext():
+            records = list(source.ingest())
+        
+        assert mock_get.call_args.kwargs['stream'] is streaming
+        assert [r['id'] for r in records] == [1, 2]
+    
+    def test_items_at_path(self):
+        """Test that the ijson prefix walk handles nested arrays and missing keys"""
+        data = [{"rows": [1, 2]}, {"rows": [3]}, {"other": [4]}]
+        
+        assert APIDataSource._items_at_path(data, "item.rows.item") == [1, 2, 3]
+        assert APIDataSource._items_at_path({"data": {"id": 1}}, "data") == [{"id": 1}]
+        assert APIDataSource._items_at_path({"data": 1}, "data.item") == []
+
+
+    @patch('src.ingestion.requests.Session.get')
+    def test_api_decode_non_utf8_body(self, mock_get, config):
+        """Test API bodies that are not UTF-8 are still decoded"""
+        payload = {"results": [{"name": "caf\u00e9"}]}
+        mock_response = make_json_response(payload)
+        mock_response.content = json.dumps(payload, ensure_ascii=False).encode("latin-1")
+        mock_get.return_value = mock_response
+        
+        source = APIDataSource(config, "https://api.example.com/data")
+        records = list(source.ingest())
+        
+        assert records[0]['name'] == "caf\u00e9"
+
+
 class TestDatabaseDataSource:
     """Test suite for Database data source"""
     
@@ -160,6 +560,56 @@ class TestDatabaseDataSource:
         assert records[0]['name'] == 'Item 1'
         assert '_source' in records[0]
         assert records[0]['_source'] == 'database'
+        
+        # Results are streamed as tuples through a named (server-side) cursor
+        cursor_kwargs = mock_connection.cursor.call_args.kwargs
+        assert cursor_kwargs['name'].startswith('ingest_')
+        assert cursor_kwargs['cursor_factory'] is psycopg2.extensions.cursor
+        assert mock_cursor.itersize == config.get("ingestion.batch_size")
+        mock_cursor.close.assert_called_once()
+    
+    @patch('src.ingestion.pymysql.connect')
+    def test_mysql_ingestion(self, mock_connect, config):
+        """Test MySQL ingestion"""
+        mock_cursor = MagicMock()
+        mock_cursor.description = [('id',), ('name',)]
+        mock_cursor.fetchmany.side_effect = [
+            [(1, 'Item 1')],
+            []  # No more rows
+        ]
+        
+        mock_connection = Mock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+        
+        source = DatabaseDataSource(config, "SELECT * FROM users", db_type="mysql")
+        records = list(source.ingest())
+        
+        assert len(records) == 1
+        assert records[0] == {
+            'id': 1,
+            'name': 'Item 1',
+            '_source': 'database',
+            '_source_db_type': 'mysql',
+            '_ingestion_timestamp': records[0]['_ingestion_timestamp']
+        }
+        mock_connection.cursor.assert_called_once_with(pymysql.cursors.SSCursor)
+    
+    @patch('src.ingestion.psycopg2.connect')
+    def test_database_ingest_batches(self, mock_connect, config):
+        """Test that fetched rows are transposed into column batches"""
+        mock_cursor = MagicMock()
+        mock_cursor.description = [('id',), ('name',)]
+        mock_cursor.fetchmany.side_effect = [[(1, 'Item 1'), (2, 'Item 2')], []]
+        mock_connect.return_value.cursor.return_value = mock_cursor
+        
+        source = DatabaseDataSource(config, "SELECT * FROM users")
+        batches = list(source.ingest_batches())
+        
+        assert len(batches) == 1
+        assert batches[0].columns == {'id': [1, 2], 'name': ['Item 1', 'Item 2']}
+        assert batches[0].metadata['_source_db_type'] == 'postgresql'
+        assert source.get_stats()['success'] == 2
     
     def test_unsupported_database_type(self, config):
         """Test error for unsupported database type"""
@@ -186,10 +636,14 @@ class TestDataIngestionPipeline:
         """Test that pipeline continues when one source fails"""
         pipeline = DataIngestionPipeline(config)
         
-        # Add a failing source
-        failing_source = CSVDataSource(config, sample_csv_file)
-        failing_source.ingest = Mock(side_effect=IngestionError("Test error"))
-        pipeline.add_source(failing_source)
+        # Add a failing source (sources use __slots__, so override via subclass)
+        class FailingCSVSource(CSVDataSource):
+            __slots__ = ()
+            
+            def ingest(self):
+                raise IngestionError("Test error")
+        
+        pipeline.add_source(FailingCSVSource(config, sample_csv_file))
         
         # Add a successful source
         success_source = CSVDataSource(config, sample_csv_file)
@@ -200,3 +654,119 @@ class TestDataIngestionPipeline:
         
         # Should have records from successful source
         assert len(records) >= 3
+    
+    def test_sources_have_no_instance_dict(self, config, sample_csv_file):
+        """Test that data sources use __slots__ instead of a per-instance dict"""
+        source = CSVDataSource(config, sample_csv_file)
+        
+        assert not hasattr(source, "__dict__")
+        
+        with pytest.raises(AttributeError):
+            source.unknown_attribute = 1
+    
+    def test_pipeline_iter_batches(self, config, sample_csv_file):
+        """Test batch iteration across sources, including row-only sources"""
+        pipeline = DataIngestionPipeline(config)
+        pipeline.add_source(CSVDataSource(config, sample_csv_file))
+        
+        with patch('src.ingestion.requests.Session.get') as mock_get:
+            mock_get.return_value = make_json_response([{"id": 1}, {"id": 2, "name": "B"}])
+            pipeline.add_source(APIDataSource(config, "https://api.example.com/data"))
+            
+            batches = list(pipeline.iter_batches())
+        
+        assert sum(len(batch) for batch in batches) == 5
+        api_batch = next(b for b in batches if b.columns.get('_source') == ['api', 'api'])
+        assert api_batch.columns['name'] == [None, 'B']
+    
+    def test_pipeline_iter_run_is_lazy(self, config, sample_csv_file):
+        """Test that iter_run streams records without draining sources upfront"""
+        pipeline = DataIngestionPipeline(config)
+        source = CSVDataSource(config, sample_csv_file)
+        pipeline.add_source(source)
+        
+        records = pipeline.iter_run()
+        first = next(records)
+        
+        assert first['_row_number'] == 2
+        assert len(list(records)) == 2
+    
+    def test_pipeline_sequential_by_default(self, config, sample_csv_file):
+        """Test that sources are drained one at a time unless parallel_workers is raised"""
+        pipeline = DataIngestionPipeline(config)
+        
+        for _ in range(3):
+            pipeline.add_source(CSVDataSource(config, sample_csv_file))
+        
+        assert pipeline.parallel_workers == 1
+        assert pipeline._worker_count() == 1
+        assert len(pipeline.run()) == 9
+    
+    def test_pipeline_parallel_sources(self, config, sample_csv_file):
+        """Test that sources drained on the thread pool are all merged"""
+        pipeline = DataIngestionPipeline(config)
+        pipeline.parallel_workers = 4
+        
+        for _ in range(3):
+            pipeline.add_source(CSVDataSource(config, sample_csv_file))
+        
+        records = pipeline.run()
+        
+        assert len(records) == 9
+        assert all(source.get_stats()['success'] == 3 for source in pipeline.sources)
+    
+    def test_pipeline_parallel_run_keeps_source_order(self, config, tmp_path):
+        """Test that run() groups records by source even when drained concurrently"""
+        pipeline = DataIngestionPipeline(config)
+        pipeline.parallel_workers = 4
+        pipeline.batch_size = 7
+        
+        for name in ("a", "b"):
+            csv_path = tmp_path / f"{name}.csv"
+            csv_path.write_text("id\n" + "".join(f"{name}{i}\n" for i in range(200)))
+            pipeline.add_source(CSVDataSource(config, str(csv_path)))
+        
+        records = pipeline.run()
+        
+        assert [r['id'] for r in records] == [f"a{i}" for i in range(200)] + [f"b{i}" for i in range(200)]
+    
+    def test_pipeline_parallel_early_close(self, config, tmp_path):
+        """Test that closing the stream early stops worker threads"""
+        pipeline = DataIngestionPipeline(config)
+        pipeline.parallel_workers = 4
+        pipeline.batch_size = 1
+        rows = pipeline.config.get("ingestion.batch_size") * 5
+        csv_path = tmp_path / "large.csv"
+        csv_path.write_text("id\n" + "".join(f"{i}\n" for i in range(rows)))
+        
+        for _ in range(3):
+            pipeline.add_source(CSVDataSource(config, str(csv_path)))
+        
+        threads_before = threading.active_count()
+        records = pipeline.iter_run()
+        next(records)
+        records.close()
+        
+        deadline = time.monotonic() + 5
+        while threading.active_count() > threads_before and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        assert threading.active_count() == threads_before
+        assert all(source.get_stats()['success'] < rows for source in pipeline.sources)
+    
+    def test_pipeline_parallel_propagates_unexpected_errors(self, config, sample_csv_file):
+        """Test that non-ingestion errors raised in a worker reach the caller"""
+        pipeline = DataIngestionPipeline(config)
+        pipeline.parallel_workers = 4
+        
+        class BrokenCSVSource(CSVDataSource):
+            __slots__ = ()
+            
+            def ingest(self):
+                raise ValueError("boom")
+        
+        pipeline.add_source(BrokenCSVSource(config, sample_csv_file))
+        pipeline.add_source(CSVDataSource(config, sample_csv_file))
+        
+        with pytest.raises(ValueError, match="boom"):
+            pipeline.run()
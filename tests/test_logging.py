@@ -1,19 +1,29 @@
 """Unit tests for Logging Configuration Module"""
 
+import gc
+import json
 import pytest
 import tempfile
 import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from src.logging_config import LoggerSetup, ErrorTracker, setup_pipeline_logger
-from src.config_manager import ConfigManager
+from src.config_manager import ConfigManager, ConfigurationError
 
 
 @pytest.fixture
-def config():
-    """Fixture providing configuration manager"""
-    return ConfigManager(config_dir="config", environment="dev")
+def config(tmp_path):
+    """Fixture providing configuration manager, logging to a temporary file"""
+    manager = ConfigManager(config_dir="config", environment="dev")
+    overrides = {"logging.file.path": str(tmp_path / "logs" / "pipeline.log")}
+    
+    wrapped = Mock(wraps=manager)
+    wrapped.get.side_effect = lambda key, default=None: overrides.get(key, manager.get(key, default))
+    return wrapped
 
 
 class TestLoggerSetup:
@@ -39,7 +49,7 @@ class TestLoggerSetup:
         logger = LoggerSetup.setup_logging(config, "test_console")
         
         console_handlers = [
-            h for h in logger.handlers 
+            h for h in LoggerSetup.get_handlers(logger.name)
             if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.handlers.RotatingFileHandler)
         ]
         
@@ -50,7 +60,7 @@ class TestLoggerSetup:
         logger = LoggerSetup.setup_logging(config, "test_file")
         
         file_handlers = [
-            h for h in logger.handlers 
+            h for h in LoggerSetup.get_handlers(logger.name)
             if isinstance(h, logging.handlers.RotatingFileHandler)
         ]
         
@@ -63,6 +73,47 @@ class TestLoggerSetup:
         
         assert logger1 is logger2
     
+    def test_logger_uses_queue_handler(self, config):
+        """Test records are handed to a background listener"""
+        logger = LoggerSetup.setup_logging(config, "test_queue")
+        
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        
+        file_handler = next(
+            h for h in LoggerSetup.get_handlers("test_queue")
+            if isinstance(h, logging.handlers.RotatingFileHandler)
+        )
+        logger.info("queued message")
+        LoggerSetup.shutdown()
+        
+        assert "queued message" in Path(file_handler.baseFilename).read_text()
+        assert LoggerSetup.get_handlers("test_queue") == []
+    
+    def test_shutdown_removes_queue_handlers(self, config, caplog):
+        """Test records logged after shutdown are not left in an undrained queue"""
+        logger = LoggerSetup.setup_logging(config, "test_after_shutdown")
+        LoggerSetup.shutdown()
+        
+        assert logger.handlers == []
+        
+        with caplog.at_level(logging.INFO):
+            logger.warning("after shutdown")
+        
+        assert "after shutdown" in caplog.text
+    
+    def test_setup_leaves_global_record_fields(self, config):
+        """Test setup does not change record fields that other loggers rely on"""
+        LoggerSetup.setup_logging(config, "test_record_fields")
+        
+        record = logging.getLogger("third_party").makeRecord(
+            "third_party", logging.INFO, __file__, 1, "msg", None, None
+        )
+        
+        assert logging._srcfile is not None
+        assert logging.logThreads
+        assert record.threadName is not None
+    
     def test_setup_pipeline_logger(self, config):
         """Test convenience function"""
         logger = setup_pipeline_logger(config)
@@ -102,10 +153,127 @@ class TestErrorTracker:
             
             record = {"id": 1, "name": "Test", "_source": "csv"}
             tracker.quarantine_record(record, "Invalid data")
+            tracker.close()
             
             # Check that file was created
-            files = list(Path(tmpdir).glob("*.json"))
+            files = list(Path(tmpdir).glob("*.jsonl"))
+            assert len(files) == 1
+    
+    def test_quarantine_records_appended(self):
+        """Test quarantined records are appended as JSON lines to one file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ErrorTracker()
+            tracker.quarantine_path = Path(tmpdir)
+            
+            for idx in range(3):
+                tracker.quarantine_record({"id": idx, "_source": "api"}, "Invalid data")
+            tracker.flush()
+            
+            files = list(Path(tmpdir).glob("*.jsonl"))
+            lines = files[0].read_text().splitlines()
+            
             assert len(files) == 1
+            assert [json.loads(line)["record"]["id"] for line in lines] == [0, 1, 2]
+            assert json.loads(lines[0])["reason"] == "Invalid data"
+            tracker.close()
+    
+    def test_quarantine_written_in_background(self):
+        """Test that quarantining returns immediately and close() stops the writer"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = ErrorTracker()
+            tracker.quarantine_path = Path(tmpdir)
+            
+            for idx in range(2500):
+                tracker.quarantine_record({"id": idx, 1: "non-string key"}, "Invalid data")
+            tracker.quarantine_record({"id": "last"}, "Invalid data")
+            
+            writer = tracker._quarantine_writer.thread
+            tracker.close()
+            
+            assert not writer.is_alive()
+            lines = next(Path(tmpdir).glob("*.jsonl")).read_text().splitlines()
+            assert len(lines) == 2501
+            assert json.loads(lines[0])["record"]["1"] == "non-string key"
+            assert json.loads(lines[-1])["record"]["id"] == "last"
+    
+    def test_quarantine_write_failure_does_not_block(self, tmp_path):
+        """Test that an unwritable quarantine file is counted and flush() returns"""
+        tracker = ErrorTracker()
+        tracker.quarantine_path = tmp_path / "missing"
+        
+        tracker.quarantine_record({"id": 1}, "Invalid data")
+        tracker.quarantine_record({"id": 2}, "Invalid data")
+        
+        flusher = threading.Thread(target=tracker.flush, daemon=True)
+        flusher.start()
+        flusher.join(timeout=5)
+        
+        assert not flusher.is_alive()
+        assert tracker.quarantine_failures == 2
+        tracker.close()
+    
+    def test_quarantine_drained_when_tracker_collected(self, tmp_path):
+        """Test that an unclosed tracker can be collected and its records still land on disk"""
+        tracker = ErrorTracker()
+        tracker.quarantine_path = tmp_path
+        tracker.quarantine_record({"id": 1}, "Invalid data")
+        
+        finalizer = tracker._quarantine_finalizer
+        tracker_ref = weakref.ref(tracker)
+        del tracker
+        gc.collect()
+        
+        assert tracker_ref() is None
+        assert not finalizer.alive
+        lines = next(tmp_path.glob("*.jsonl")).read_text().splitlines()
+        assert json.loads(lines[0])["record"]["id"] == 1
+    
+    def test_close_detaches_exit_finalizer(self, tmp_path):
+        """Test that close() runs the finalizer so nothing is left for interpreter exit"""
+        tracker = ErrorTracker()
+        tracker.quarantine_path = tmp_path
+        tracker.quarantine_record({"id": 1}, "Invalid data")
+        
+        finalizer = tracker._quarantine_finalizer
+        tracker.close()
+        
+        assert not finalizer.alive
+        assert tracker._quarantine_writer is None
+    
+    def test_quarantine_files_unique_within_a_second(self, tmp_path):
+        """Test that trackers started in the same second write separate files"""
+        trackers = [ErrorTracker() for _ in range(2)]
+        
+        with patch("src.logging_config.datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value.strftime.return_value = "20260101_000000"
+            for idx, tracker in enumerate(trackers):
+                tracker.quarantine_path = tmp_path
+                tracker.quarantine_record({"id": idx}, "Invalid data")
+        
+        for tracker in trackers:
+            tracker.close()
+        
+        files = sorted(tmp_path.glob("quarantine_20260101_000000_*.jsonl"))
+        assert len(files) == 2
+        assert sorted(json.loads(path.read_text())["record"]["id"] for path in files) == [0, 1]
+    
+    def test_quarantine_concurrent_with_close(self, tmp_path):
+        """Test that records quarantined while another thread closes are all written"""
+        tracker = ErrorTracker()
+        tracker.quarantine_path = tmp_path
+        
+        def quarantine(start):
+            for idx in range(start, start + 200):
+                tracker.quarantine_record({"id": idx}, "Invalid data")
+                if idx % 50 == 0:
+                    tracker.close()
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(quarantine, range(0, 800, 200)))
+        tracker.close()
+        
+        lines = [line for path in tmp_path.glob("*.jsonl") for line in path.read_text().splitlines()]
+        assert sorted(json.loads(line)["record"]["id"] for line in lines) == list(range(800))
     
     def test_get_error_summary(self):
         """Test getting error summary"""
@@ -138,6 +306,10 @@ class TestErrorTracker:
         
         assert len(tracker.errors) == 0
         assert len(tracker.warnings) == 0
+        
+        summary = tracker.get_error_summary()
+        assert summary["total_errors"] == 0
+        assert summary["total_warnings"] == 0
     
     def test_multiple_errors_different_types(self):
         """Test tracking multiple error types"""
@@ -153,3 +325,118 @@ class TestErrorTracker:
         assert len(summary["error_types"]) == 2
         assert summary["error_types"]["ValueError"] == 2
         assert summary["error_types"]["KeyError"] == 1
+    
+    def test_error_details_bounded(self, monkeypatch):
+        """Test that old error details are dropped but still counted"""
+        monkeypatch.setattr(ErrorTracker, "MAX_TRACKED_ERRORS", 2)
+        tracker = ErrorTracker()
+        
+        for i in range(5):
+            tracker.log_error(ValueError(f"error {i}"), "context")
+        
+        summary = tracker.get_error_summary()
+        
+        assert len(tracker.errors) == 2
+        assert tracker.errors[0]["error_message"] == "error 3"
+        assert summary["total_errors"] == 5
+        assert summary["error_types"] == {"ValueError": 5}
+    
+    def test_error_summary_materializes_entries(self):
+        """Test that column-stored errors come back as full dicts"""
+        tracker = ErrorTracker()
+        record = {"id": 1}
+        tracker.log_error(KeyError("id"), "lookup", record)
+        
+        errors = tracker.get_error_summary()["errors"]
+        
+        assert errors == [tracker.errors[-1]]
+        assert set(errors[0]) == {"timestamp", "context", "error_type", "error_message", "record"}
+        assert errors[0]["error_type"] == "KeyError"
+        assert errors[0]["record"] is record
+    
+    
+    def test_error_log_reads_like_a_list(self):
+        """Test that tracked errors support list-style append, slicing and equality"""
+        tracker = ErrorTracker()
+        tracker.log_error(ValueError("first"), "parse")
+        entry = {
+            "timestamp": "2024-01-01T00:00:00", "context": "load",
+            "error_type": "KeyError", "error_message": "'id'", "record": {"id": 1}
+        }
+        tracker.errors.append(entry)
+        
+        assert tracker.errors[1:] == [entry]
+        assert tracker.errors[-1] == entry
+        assert tracker.errors == [tracker.errors[0], entry]
+        assert tracker.errors != [entry]
+    
+    @pytest.mark.parametrize("value", [0, -1, "100", 2.5, True])
+    def test_max_tracked_errors_rejects_invalid_values(self, value):
+        """Test that a max_tracked_errors that would drop or misread details fails loudly"""
+        config = Mock()
+        config.get.return_value = value
+        
+        with pytest.raises(ConfigurationError, match="max_tracked_errors"):
+            ErrorTracker(config=config)
+    
+    def test_max_tracked_errors_null_keeps_every_error(self):
+        """Test that a null max_tracked_errors keeps all error details"""
+        config = Mock()
+        config.get.return_value = None
+        tracker = ErrorTracker(config=config)
+        
+        for idx in range(50):
+            tracker.log_error(ValueError(str(idx)), "context")
+        
+        assert len(tracker.errors) == 50
+    
+    def test_concurrent_errors_stay_aligned(self):
+        """Test that errors logged from parallel threads keep their own fields"""
+        config = Mock()
+        config.get.return_value = 50
+        tracker = ErrorTracker(logger=logging.getLogger("test.concurrent"), config=config)
+        tracker.logger.disabled = True
+        
+        def worker(thread_id):
+            for i in range(500):
+                tracker.log_error(ValueError(f"{thread_id}:{i}"), f"thread-{thread_id}", {"i": i})
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, range(8)))
+        
+        assert tracker.error_count == 4000
+        assert len(tracker.errors) == 50
+        for error in tracker.errors:
+            thread_id, i = error["error_message"].split(":")
+            assert error["context"] == f"thread-{thread_id}"
+            assert error["record"] == {"i": int(i)}
+    def test_warning_details_bounded_by_config(self):
+        """Test that the detail cap comes from config and totals stay exact"""
+        config = Mock()
+        config.get.return_value = 2
+        tracker = ErrorTracker(config=config)
+        
+        for i in range(5):
+            tracker.log_warning(f"warning {i}", "context")
+        
+        summary = tracker.get_error_summary()
+        
+        config.get.assert_called_once_with("error_handling.max_tracked_errors", 10_000)
+        assert [w["message"] for w in summary["warnings"]] == ["warning 3", "warning 4"]
+        assert summary["total_warnings"] == 5
+    
+    def test_timestamp_reused_within_millisecond(self):
+        """Test that error timestamps are formatted once per millisecond"""
+        tracker = ErrorTracker()
+        
+        with patch("src.logging_config.time.time_ns", side_effect=[
+            1_700_000_000_000_000_000,
+            1_700_000_000_000_500_000,
+            1_700_000_000_002_000_000
+        ]):
+            for i in range(3):
+                tracker.log_warning(f"warning {i}", "context")
+        
+        timestamps = [warning["timestamp"] for warning in tracker.warnings]
+        assert timestamps[0] == timestamps[1] == "2023-11-14T22:13:20"
+        assert timestamps[2] == "2023-11-14T22:13:20.002000"
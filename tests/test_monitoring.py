@@ -4,9 +4,13 @@ import pytest
 import tempfile
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import Mock, patch
 
-from src.monitoring import MetricsCollector, PipelineMonitor
+from src.config_manager import ConfigurationError
+from src.monitoring import LevelAggregator, MetricsCollector, PipelineMonitor, _iso_from_ns
 
 
 class TestMetricsCollector:
@@ -34,6 +38,79 @@ class TestMetricsCollector:
         assert collector.end_time is not None
         assert collector.end_time > collector.start_time
     
+    def test_event_timestamps_formatted_on_read(self):
+        """Test that stored nanosecond timestamps read back as ISO strings"""
+        collector = MetricsCollector()
+        before = datetime.utcnow()
+        
+        collector.start_pipeline()
+        collector.record_ingestion("csv", success=True, duration=0.5)
+        collector.record_quality_score(90.0)
+        collector.end_pipeline()
+        
+        for events in collector.metrics.values():
+            for event in events:
+                assert datetime.fromisoformat(event["timestamp"]) >= before.replace(microsecond=0)
+        
+        summary = collector.get_summary()
+        assert summary["pipeline"]["total_duration_seconds"] >= 0
+    
+    def test_events_stored_as_tuples(self):
+        """Test that raw events are compact tuples expanded only on read"""
+        collector = MetricsCollector()
+        collector.start_pipeline()
+        collector.record_validation(valid=False, errors=["missing id"])
+        collector.end_pipeline()
+        
+        assert isinstance(collector._events["validations"][0], tuple)
+        
+        metrics = collector.metrics
+        assert set(metrics["validations"][0]) == {"timestamp", "valid", "error_count"}
+        assert metrics["pipeline_completions"][0]["duration_seconds"] >= 0
+        assert "start_time" in metrics["pipeline_starts"][0]
+    
+    def test_metrics_are_read_only_views(self):
+        """Test that metrics and source_metrics read like dicts and follow new events"""
+        collector = MetricsCollector()
+        metrics = collector.metrics
+        source_metrics = collector.source_metrics
+        
+        collector.record_ingestion("csv", success=True, duration=0.5)
+        collector.record_validation(valid=True)
+        
+        assert set(metrics) == {"validations", "ingestions"}
+        assert metrics["ingestions"][0]["source"] == "csv"
+        assert metrics.get("quality_scores") is None
+        assert source_metrics == {
+            "csv": {"success_count": 1, "failure_count": 0, "total_duration": 0.5, "record_count": 1}
+        }
+        
+        collector.record_ingestion("csv", success=False)
+        assert source_metrics["csv"]["record_count"] == 2
+        
+        with pytest.raises(TypeError):
+            source_metrics["csv"]["record_count"] = 10
+        with pytest.raises(TypeError):
+            metrics["custom"] = []
+    
+    def test_alternating_sources_keep_separate_totals(self):
+        """Test that alternating and repeated sources keep separate totals"""
+        collector = MetricsCollector()
+        
+        for source in ["csv", "csv", "api", "csv", "".join(["a", "pi"])]:
+            collector.record_ingestion(source, success=True)
+        
+        breakdown = collector.source_metrics
+        assert breakdown["csv"]["success_count"] == 3
+        assert breakdown["api"]["success_count"] == 2
+        assert list(breakdown) == ["csv", "api"]
+    
+    def test_iso_from_ns_matches_isoformat(self):
+        """Test that cached-second formatting matches datetime.isoformat()"""
+        for timestamp_ns in (0, 1_700_000_000_000_000_000, 1_700_000_000_000_123_456, 1_700_000_000_999_999_999):
+            expected = (datetime(1970, 1, 1) + timedelta(microseconds=timestamp_ns // 1000)).isoformat()
+            assert _iso_from_ns(timestamp_ns) == expected
+    
     def test_record_ingestion_success(self):
         """Test recording successful ingestion"""
         collector = MetricsCollector()
@@ -67,6 +144,27 @@ class TestMetricsCollector:
         assert collector.source_metrics["csv"]["failure_count"] == 1
         assert collector.source_metrics["csv"]["record_count"] == 3
     
+    def test_source_metrics_multiple_sources(self):
+        """Test per-source totals and event order across several sources"""
+        collector = MetricsCollector()
+        
+        for source in ["csv", "api", "db", "api", "csv", "api"]:
+            collector.record_ingestion(source, success=source != "db", duration=0.25)
+        
+        breakdown = collector.get_summary()["ingestion"]["source_breakdown"]
+        
+        assert list(breakdown) == ["csv", "api", "db"]
+        assert breakdown["api"] == {
+            "success_count": 3,
+            "failure_count": 0,
+            "total_duration": 0.75,
+            "record_count": 3
+        }
+        assert breakdown["db"]["failure_count"] == 1
+        assert [e["source"] for e in collector.metrics["ingestions"]] == [
+            "csv", "api", "db", "api", "csv", "api"
+        ]
+    
     def test_record_validation(self):
         """Test recording validation results"""
         collector = MetricsCollector()
@@ -117,6 +215,25 @@ class TestMetricsCollector:
         
         assert summary["quality"]["average_score"] == 92.0
     
+    def test_summary_uses_running_totals(self):
+        """Test that summary aggregates do not depend on the raw event lists"""
+        collector = MetricsCollector()
+        
+        collector.record_ingestion("csv", success=True, duration=0.5)
+        collector.record_ingestion("csv", success=True, duration=1.5)
+        collector.record_validation(valid=True)
+        collector.record_validation(valid=False)
+        collector.record_quality_score(90.0)
+        collector.record_quality_score(80.0)
+        collector._events.clear()
+        
+        summary = collector.get_summary()
+        
+        assert summary["ingestion"]["total_ingestions"] == 2
+        assert summary["ingestion"]["average_duration_seconds"] == 1.0
+        assert summary["validation"]["validation_rate_percent"] == 50.0
+        assert summary["quality"]["average_score"] == 85.0
+    
     def test_export_metrics(self):
         """Test exporting metrics to file"""
         collector = MetricsCollector()
@@ -137,6 +254,114 @@ class TestMetricsCollector:
             assert "pipeline" in data
             assert "records" in data
             assert "raw_metrics" in data
+    
+    def test_event_log_is_bounded(self):
+        """Test that raw events are kept in a fixed-size ring buffer"""
+        collector = MetricsCollector(max_event_log=3)
+        
+        for i in range(5):
+            collector.record_ingestion("csv", success=True, duration=i)
+        
+        events = collector.metrics["ingestions"]
+        assert [e["duration_seconds"] for e in events] == [2, 3, 4]
+        assert collector.get_summary()["ingestion"]["total_ingestions"] == 5
+    
+    def test_export_metrics_streams_chunks(self, tmp_path):
+        """Test that chunked raw metric export still produces valid JSON"""
+        collector = MetricsCollector()
+        collector.EXPORT_CHUNK_SIZE = 2
+        for i in range(5):
+            collector.record_ingestion("csv", success=True, duration=i)
+        collector.record_quality_score(90.0)
+        filepath = tmp_path / "metrics.json"
+        
+        collector.export_metrics(str(filepath))
+        
+        data = json.loads(filepath.read_text())
+        raw = data["raw_metrics"]
+        assert [e["duration_seconds"] for e in raw["ingestions"]] == [0, 1, 2, 3, 4]
+        assert raw["quality_scores"][0]["score"] == 90.0
+        assert data["records"]["total_processed"] == 5
+    
+    def test_export_metrics_without_orjson(self, tmp_path):
+        """Test that export falls back to the stdlib encoder"""
+        collector = MetricsCollector()
+        collector.record_ingestion("csv", success=True, duration=0.5)
+        filepath = tmp_path / "metrics.json"
+        
+        with patch("src.monitoring.orjson", None):
+            collector.export_metrics(str(filepath))
+        
+        data = json.loads(filepath.read_text())
+        assert data["records"]["total_processed"] == 1
+        assert len(data["raw_metrics"]["ingestions"]) == 1
+    
+    def test_concurrent_recording(self):
+        """Test that counts are exact when several threads share a collector"""
+        collector = MetricsCollector(max_event_log=100)
+        
+        def worker(source):
+            for i in range(500):
+                collector.record_ingestion(source, success=i % 5 != 0, duration=0.001)
+                collector.record_validation(valid=True)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, ["csv", "api", "db", "csv"] * 2))
+        
+        summary = collector.get_summary()
+        assert summary["ingestion"]["total_ingestions"] == 4000
+        assert summary["records"]["total_processed"] == 3200
+        assert summary["ingestion"]["source_breakdown"]["csv"]["record_count"] == 2000
+        assert summary["validation"]["total_validations"] == 4000
+        assert len(collector.metrics["ingestions"]) == 100
+
+
+class TestLevelAggregator:
+    """Test suite for LevelAggregator"""
+    
+    def test_roll_up_and_window_query(self):
+        """Test that old minutes roll into hours and windows merge buckets"""
+        aggregator = LevelAggregator()
+        
+        aggregator.add(0, count=1, success_count=1)
+        aggregator.add(1800, count=1, success_count=0)
+        aggregator.add(3600 + 120, count=2, success_count=2)
+        
+        # Only minutes more than RETAIN_MINUTES before the newest one roll up
+        assert list(aggregator.hour_buckets) == [0]
+        assert aggregator.hour_buckets[0]["count"] == 1
+        assert list(aggregator.minute_buckets) == [30, 62]
+        
+        assert aggregator.query(3600)["count"] == 2
+        assert aggregator.query(0)["count"] == 4
+        assert aggregator.query(0)["success_count"] == 3
+    
+    def test_window_across_hour_boundary(self):
+        """Test that a short window just after the hour ignores the previous hour"""
+        aggregator = LevelAggregator()
+        top_of_hour = 10 * 3600
+        
+        for minute in range(60):
+            aggregator.add(top_of_hour - 3600 + minute * 60, count=1, success_count=1)
+        aggregator.add(top_of_hour + 60, count=1, success_count=0)
+        
+        # Five-minute window ending 90s past the hour: minutes -4..-1 and +1
+        window = aggregator.query(top_of_hour + 90 - 300)
+        
+        assert window["count"] == 5
+        assert window["success_count"] == 4
+        assert aggregator.query(0)["count"] == 61
+    
+    def test_late_event_for_rolled_up_minute(self):
+        """Test that an event older than the retained minutes lands in its hour"""
+        aggregator = LevelAggregator()
+        
+        aggregator.add(3 * 3600, count=1)
+        aggregator.add(3600, count=1)
+        
+        assert aggregator.hour_buckets[1]["count"] == 1
+        assert aggregator.query(3 * 3600)["count"] == 1
+        assert aggregator.query(0)["count"] == 2
 
 
 class TestPipelineMonitor:
@@ -150,6 +375,30 @@ class TestPipelineMonitor:
         assert len(monitor.alerts) == 0
         assert "min_success_rate" in monitor.thresholds
     
+    def test_max_event_log_null_keeps_every_event(self):
+        """Test that a null max_event_log keeps all events, ingestions included"""
+        config = Mock()
+        config.get.return_value = None
+        monitor = PipelineMonitor(config)
+        
+        # More than the initial ring buffer capacity, so the arrays must grow
+        for i in range(200):
+            monitor.metrics_collector.record_ingestion("csv", success=True, duration=i)
+        monitor.metrics_collector.record_validation(valid=True)
+        
+        events = monitor.metrics_collector.metrics["ingestions"]
+        assert [e["duration_seconds"] for e in events] == list(range(200))
+        assert len(monitor.metrics_collector.metrics["validations"]) == 1
+    
+    @pytest.mark.parametrize("value", [0, -1, "100", True])
+    def test_max_event_log_rejects_invalid_values(self, value):
+        """Test that a max_event_log that would drop or misread events fails loudly"""
+        config = Mock()
+        config.get.return_value = value
+        
+        with pytest.raises(ConfigurationError, match="max_event_log"):
+            PipelineMonitor(config)
+    
     def test_set_threshold(self):
         """Test setting custom thresholds"""
         monitor = PipelineMonitor()
@@ -209,6 +458,23 @@ class TestPipelineMonitor:
         quality_issues = [i for i in health["issues"] if i["metric"] == "quality_score"]
         assert len(quality_issues) > 0
     
+    def test_health_check_slow_ingestion_degraded(self):
+        """Test that a medium-severity breach alone marks the run degraded"""
+        monitor = PipelineMonitor()
+        monitor.metrics_collector.record_ingestion("csv", success=True, duration=120.0)
+        
+        health = monitor.check_health()
+        
+        assert health["status"] == "degraded"
+        assert health["issues"] == [{
+            "severity": "medium",
+            "metric": "avg_duration",
+            "value": 120.0,
+            "threshold": 60.0,
+            "message": "Average duration 120.0s exceeds threshold 60.0s"
+        }]
+        assert monitor.alerts == []
+    
     def test_generate_alert(self):
         """Test alert generation"""
         monitor = PipelineMonitor()
@@ -267,3 +533,18 @@ class TestPipelineMonitor:
         
         health = monitor.check_health()
         assert health["status"] == "healthy"
+    
+    def test_health_check_window(self):
+        """Test that a windowed health check only sees recent buckets"""
+        monitor = PipelineMonitor()
+        collector = monitor.metrics_collector
+        
+        # Failures two hours ago, successes now
+        old = time.time() - 7200
+        for _ in range(10):
+            collector.aggregator.add(old, sum_duration=0.1, count=1, success_count=0)
+        for _ in range(10):
+            collector.record_ingestion("csv", success=True, duration=0.1)
+        
+        assert monitor.check_health(window_seconds=300)["status"] == "healthy"
+        assert monitor.check_health()["window_seconds"] is None
@@ -1,20 +1,25 @@
 """Unit tests for Schema Validation Module"""
 
+import re
 import pytest
 import tempfile
 from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import yaml
 
 from src.validation import SchemaValidator, DataQualityChecker, ValidationError
 from src.config_manager import ConfigManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     """Fixture providing configuration manager"""
     return ConfigManager(config_dir="config", environment="dev")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_schema():
     """Fixture providing a sample schema"""
     return {
@@ -125,6 +130,21 @@ class TestSchemaValidator:
         assert result['valid'] is False
         assert any("age" in error.lower() and "maximum" in error.lower() for error in result['errors'])
     
+    def test_fail_fast_stops_at_first_error(self, config, sample_schema):
+        """Test that fail_fast reports only the first error"""
+        validator = SchemaValidator(sample_schema, config)
+        record = {"id": 0, "name": "J", "email": "invalid_email", "age": 200}
+        
+        full = validator.validate(record)
+        fast = validator.validate(record, fail_fast=True)
+        
+        assert len(full['errors']) > 1
+        assert fast['valid'] is False
+        assert fast['errors'] == full['errors'][:1]
+        
+        valid = {"id": 1, "name": "John", "email": "john@example.com"}
+        assert validator.validate(valid, fail_fast=True)['valid'] is True
+    
     def test_string_length_validation(self, config):
         """Test string length validation"""
         schema = {
@@ -176,12 +196,148 @@ class TestSchemaValidator:
         result = validator.validate({"status": "unknown"})
         assert result['valid'] is False
     
+    def test_metadata_fields_allowed(self, config, sample_schema):
+        """Test that ingestion metadata is accepted while other extras are not"""
+        validator = SchemaValidator(sample_schema, config)
+        validator.allow_extra_fields = False
+        record = {
+            "id": 1,
+            "name": "John Doe",
+            "email": "john@example.com",
+            "_source": "csv",
+            "_row_number": 2
+        }
+        
+        assert validator.validate(record)['valid'] is True
+        
+        record["nickname"] = "JD"
+        result = validator.validate(record)
+        
+        assert result['valid'] is False
+        assert result['errors'] == ["Unexpected fields: nickname"]
+    
+    def test_pattern_validation(self, config):
+        """Test user-supplied pattern validation"""
+        schema = {
+            "name": "test",
+            "fields": {
+                "code": {"type": "string", "required": True, "pattern": r"^[A-Z]{3}$"}
+            }
+        }
+        
+        validator = SchemaValidator(schema, config)
+        
+        assert validator.validate({"code": "ABC"})['valid'] is True
+        assert validator.validate({"code": "abc"})['valid'] is False
+    
+    def test_pattern_falls_back_when_re2_rejects(self, config):
+        """Test that patterns RE2 cannot compile use the re module instead"""
+        schema = {
+            "name": "test",
+            "fields": {"code": {"type": "string", "pattern": r"^(a)\1$"}}
+        }
+        fake_re2 = Mock(error=re.error)
+        fake_re2.compile.side_effect = re.error("backreferences not supported")
+        
+        with patch("src.validation.re2", fake_re2):
+            validator = SchemaValidator(schema, config)
+        
+        fake_re2.compile.assert_called_once_with(r"^(a)\1$")
+        assert validator.validate({"code": "aa"})['valid'] is True
+    
+    def test_batch_pattern_screen_uses_re2(self, config):
+        """Test that the batch screen agrees with validate() when RE2 compiles the pattern"""
+        schema = {
+            "name": "test",
+            "fields": {"code": {"type": "string", "pattern": r"^\d+$"}}
+        }
+        # RE2's \d is ASCII-only, unlike the re module's
+        fake_re2 = Mock(error=re.error)
+        fake_re2.compile.side_effect = lambda pattern: Mock(match=re.compile(pattern, re.ASCII).match)
+        
+        with patch("src.validation.re2", fake_re2):
+            validator = SchemaValidator(schema, config)
+        
+        valid, errors = validator.validate_batch(pd.DataFrame({"code": ["123", "\u0661\u0662\u0663"]}))
+        
+        assert valid.tolist() == [True, False]
+        assert errors[1] == ["Field 'code' does not match required pattern"]
+    
+    def test_invalid_pattern_definition(self, config):
+        """Test that a malformed pattern is rejected when the schema loads"""
+        schema = {
+            "name": "test",
+            "fields": {"code": {"type": "string", "pattern": "[A-Z"}}
+        }
+        
+        with pytest.raises(ValidationError, match="invalid pattern"):
+            SchemaValidator(schema, config)
+    
+    def test_generated_checks_match_field_validation(self, config):
+        """Test that the schema-specialized checks agree with _validate_field"""
+        schema = {
+            "name": "test",
+            "fields": {
+                "code": {
+                    "type": "string", "required": True, "min_length": 2,
+                    "max_length": 4, "pattern": r"^[a-z]+$", "enum": ["ab", "abc"]
+                },
+                "count": {"type": "integer", "min": 0, "max": 10},
+                "ratio": {"type": "float", "min": 0.5},
+                "flag": {"type": "boolean", "required": True},
+                "email": {"type": "email"},
+                "joined": {"type": "date"}
+            }
+        }
+        values = [
+            None, "", 0, 5, 11, -1, 2.5, True, "abc", "a", "ABCDE", "true",
+            "2024-01-01", "john@example.com", [1]
+        ]
+        validator = SchemaValidator(schema, config)
+        
+        for name, field_def in schema["fields"].items():
+            for value in values:
+                errors = []
+                validator._validate_fields({name: value}, errors)
+                assert errors == validator._validate_field(name, value, field_def)
+    
+    def test_validate_batch(self, config, sample_schema):
+        """Test columnar batch validation against row-wise results"""
+        validator = SchemaValidator(sample_schema, config)
+        validator.allow_extra_fields = False
+        df = pd.DataFrame({
+            "id": [1, 2, 0, 4],
+            "name": ["John Doe", "Jane Smith", "Bob", "X"],
+            "email": ["john@example.com", "jane@example.com", "bob@example.com", "bad"],
+            "age": [30, None, 40, 200],
+            "_row_number": [2, 3, 4, 5]
+        })
+        
+        valid, errors = validator.validate_batch(df)
+        
+        assert valid.tolist() == [True, True, False, False]
+        assert errors[0] == [] and errors[1] == []
+        assert errors[2] == ["Field 'id' value 0 below minimum 1"]
+        assert len(errors[3]) == 3
+    
+    def test_validate_batch_skips_row_checks_for_valid_rows(self, config, sample_schema):
+        """Test that clean batches never fall back to row-wise validation"""
+        df = pd.DataFrame({
+            "id": [1, 2],
+            "name": ["John Doe", "Jane Smith"],
+            "email": ["john@example.com", "jane@example.com"],
+            "age": [30.0, None]
+        })
+        validator = SchemaValidator(sample_schema, config)
+        
+        with patch.object(SchemaValidator, "validate") as mock_validate:
+            valid, errors = validator.validate_batch(df)
+        
+        assert valid.all()
+        mock_validate.assert_not_called()
+    
     def test_allow_extra_fields(self, config, sample_schema):
         """Test allowing extra fields not in schema"""
-        # Create config that allows extra fields
-        config_dict = config.get_all()
-        config_dict['validation']['schema']['allow_extra_fields'] = True
-        
         validator = SchemaValidator(sample_schema, config)
         validator.allow_extra_fields = True
         
@@ -211,6 +367,19 @@ class TestSchemaValidator:
         result = validator.validate(record)
         assert result['valid'] is True
     
+    def test_schema_file_parsed_once(self, config, tmp_path):
+        """Test that unchanged schema files are not re-parsed"""
+        schema_path = tmp_path / "schema.yaml"
+        schema_path.write_text("fields:\n  id: {type: integer, required: true}\n")
+        
+        with patch("src.validation.yaml.load", wraps=yaml.load) as mock_load:
+            first = SchemaValidator.from_file(str(schema_path), config)
+            second = SchemaValidator.from_file(str(schema_path), config)
+        
+        assert mock_load.call_count == 1
+        assert first.schema == second.schema
+        assert first.schema is not second.schema
+    
     def test_invalid_schema_definition(self, config):
         """Test error handling for invalid schema definition"""
         invalid_schema = {
@@ -240,6 +409,43 @@ class TestDataQualityChecker:
         assert "null_percentage" in report['checks']
         assert report['checks']['null_percentage'] > 0
     
+    def test_check_quality_df_skips_metadata(self, config):
+        """Test DataFrame quality checks ignore ingestion metadata columns"""
+        checker = DataQualityChecker(config)
+        
+        df = pd.DataFrame({
+            "id": [1, 2, 1, 3],
+            "name": ["John", "", "John", None],
+            "_row_number": [2, 3, 4, 5]
+        })
+        
+        report = checker.check_quality_df(df)
+        
+        assert report['total_records'] == 4
+        assert report['checks']['null_percentage'] == 25.0
+        assert report['checks']['duplicate_count'] == 1
+    
+    def test_heterogeneous_records_keep_their_own_keys(self, config):
+        """Test that missing keys and NaN values are not counted as nulls or matches"""
+        checker = DataQualityChecker(config)
+        
+        records = [
+            {"id": 1, "name": "John", "_row_number": 2},
+            {"id": 2},  # No name key: not a null
+            {"id": 3, "score": float("nan")},  # NaN is a value, not a null
+            {"id": 4, "name": None},
+            {"id": 4},  # Differs from the previous record by its keys
+            {"id": 1, "name": "John"},  # Duplicate, metadata aside
+            {"id": 5, "tags": ["a"]},
+            {"id": 5, "tags": ["a"]}  # Duplicate with an unhashable value
+        ]
+        
+        report = checker.check_quality(records)
+        
+        # One null (name=None) among 14 present non-metadata values
+        assert report['checks']['null_percentage'] == round(1 / 14 * 100, 2)
+        assert report['checks']['duplicate_count'] == 2
+    
     def test_duplicate_check(self, config):
         """Test duplicate record detection"""
         checker = DataQualityChecker(config)
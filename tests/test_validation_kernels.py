@@ -0,0 +1,83 @@
+"""Unit tests for Validation Kernels Module"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.validation_kernels import (
+    count_duplicate_codes,
+    count_duplicate_rows,
+    count_nulls_and_duplicates,
+    factorize_columns
+)
+
+
+class TestValidationKernels:
+    """Test suite for validation array kernels"""
+    
+    def test_factorize_columns(self):
+        """Test that equal values share ids and nulls are counted per column"""
+        data = pd.DataFrame({"id": [1, 2, 1], "name": ["a", "", None]})
+        
+        codes, null_counts = factorize_columns(data)
+        
+        assert codes.shape == (3, 2)
+        assert codes[0, 0] == codes[2, 0]
+        assert codes[2, 1] == -1
+        assert null_counts.tolist() == [0, 2]
+    
+    def test_factorize_unhashable_values(self):
+        """Test that unhashable column values raise TypeError"""
+        data = pd.DataFrame({"tags": [["a"], ["b"]]})
+        
+        with pytest.raises(TypeError):
+            factorize_columns(data)
+    
+    def test_count_nulls_and_duplicates(self):
+        """Test fused null and duplicate counting"""
+        data = pd.DataFrame({
+            "id": [1, 2, 1, 3],
+            "name": ["John", None, "John", None]
+        })
+        
+        null_count, duplicates = count_nulls_and_duplicates(*factorize_columns(data))
+        
+        assert null_count == 2
+        assert duplicates == 1
+    
+    def test_count_without_columns(self):
+        """Test edge cases with no rows or no columns"""
+        assert count_nulls_and_duplicates(
+            np.empty((0, 2), dtype=np.int64), np.zeros(2, dtype=np.int64)
+        ) == (0, 0)
+        assert count_nulls_and_duplicates(
+            np.empty((3, 0), dtype=np.int64), np.zeros(0, dtype=np.int64)
+        ) == (0, 2)
+    
+    def test_count_duplicate_codes(self):
+        """Test duplicate counting on factorized rows alone"""
+        codes = np.array([[0, 1], [1, 1], [0, 1], [0, -1]], dtype=np.int64)
+        
+        assert count_duplicate_codes(codes) == 1
+        assert count_duplicate_codes(np.empty((0, 2), dtype=np.int64)) == 0
+    
+    def test_count_duplicate_rows_nested_values(self):
+        """Test hashed duplicate detection ignores nested key order"""
+        rows = [
+            {"id": 1, "meta": {"a": 1, "b": [1, 2]}},
+            {"id": 1, "meta": {"b": [1, 2], "a": 1}},
+            {"id": 2, "meta": {"a": 1, "b": [1, 2]}}
+        ]
+        
+        assert count_duplicate_rows(rows) == 1
+    
+    def test_count_duplicate_rows_without_accelerators(self):
+        """Test the stdlib JSON and builtin hash fallbacks"""
+        rows = [{"tags": ["a"]}, {"tags": ["a"]}, {"tags": ["b"]}]
+        
+        with patch("src.validation_kernels.orjson", None), \
+                patch("src.validation_kernels.xxhash", None):
+            assert count_duplicate_rows(rows) == 1
+